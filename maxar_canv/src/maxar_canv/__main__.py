@@ -1,12 +1,20 @@
 from __future__ import annotations  # noqa
 
 import argparse
-from itertools import islice
+import multiprocessing
+import os
 import pathlib
+import queue
 import sys
+import threading
 from typing import Any, Dict
 
-from maxar_canv import Canv, Ims, Playback, validate_canv, validate_ims
+from maxar_canv import Canv, Ims, validate_canv, validate_ims
+from maxar_canv.transcode import init_transcoder, transcode_frame
+
+# Alias for the builtin range, which is shadowed by the range parameter
+# of do_slice_canv.
+_range = range
 
 
 def command_line() -> str:
@@ -188,16 +196,91 @@ def do_slice_canv(source_canv_path: pathlib.Path,
     target_ims.append_command(cmd, tag='0.0.1')
 
     # Iterate over the selected slice and write the new Canv and Ims.
-    for data in islice(Playback(source_canv, source_ims), range[0], range[1]):
-        if data is not None:
-            metadata, image = data
-
-            image = image.resize(image_size) if resize else image
-            target_canv.append(metadata)
-            target_ims.append(image)
+    # The metadata is copied as is, without any JSON decoding or encoding,
+    # and so are the images when they are not resized. Otherwise frames are
+    # read, decoded, scaled and encoded by a pool of worker processes, each
+    # with its own source archives. The Ims-archive is only written from
+    # this thread and the Canv-archive only from a metadata writer thread,
+    # both in frame order. The metadata queue is bounded, so that this
+    # thread never gets far ahead of the writer, and stops soon after a
+    # failure of it.
+    processes = os.cpu_count() or 1
+    metadata_queue = queue.Queue(maxsize=4 * processes)
+    metadata_errors = list()
+
+    def write_metadata() -> None:
+        get_metadata = metadata_queue.get
+        append_metadata = target_canv.append_raw
+        while (metadata := get_metadata()) is not None:
+            # After a failure the queue is still drained until the end,
+            # but nothing more is written. The failure makes the main
+            # thread stop, and is reported by it.
+            if len(metadata_errors) == 0:
+                try:
+                    append_metadata(metadata)
+                except Exception as e:
+                    metadata_errors.append(e)
+
+    # The worker processes are started before the metadata writer thread,
+    # since forking a process with running threads can deadlock it.
+    pool = None
+    if resize:
+        pool = multiprocessing.Pool(processes, initializer=init_transcoder,
+                                    initargs=(source_canv_path, image_size))
+
+    metadata_writer = threading.Thread(target=write_metadata)
+    metadata_writer.start()
+
+    # The per-frame work of this thread is only to hand over data, so the
+    # methods used for every frame are looked up once.
+    put_metadata = metadata_queue.put
+    append_image = target_ims.append_raw
+
+    try:
+        if pool is not None:
+            # Frames are handed out in small contiguous chunks, to keep
+            # inter-process overhead low while results still arrive in
+            # a steady flow for the writers.
+            for data in pool.imap(transcode_frame, _range(*range), chunksize=8):
+                if len(metadata_errors) > 0:
+                    break
+                elif data is not None:
+                    metadata, encoded = data
+
+                    put_metadata(metadata)
+                    append_image(encoded)
+                else:
+                    print('Playback of source failed')
+                    return False
         else:
-            print('Playback of source failed')
-            return False
+            for frame_nr in _range(*range):
+                if len(metadata_errors) > 0:
+                    break
+
+                metadata = source_canv.read_raw(frame_nr)
+                encoded = source_ims.read_raw(frame_nr)
+                if not metadata is None and not encoded is None:
+                    put_metadata(metadata)
+                    append_image(encoded)
+                else:
+                    print('Playback of source failed')
+                    return False
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+        metadata_queue.put(None)
+        metadata_writer.join()
+
+        # Close the targets to write their index and proc, also when
+        # failing.
+        target_canv.close()
+        target_ims.close()
+
+    if len(metadata_errors) > 0:
+        print(f'Writing of target metadata failed: {metadata_errors[0]}')
+        return False
 
     # Done!
     return True
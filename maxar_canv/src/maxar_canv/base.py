@@ -1,6 +1,8 @@
 from __future__ import annotations  # noqa
 
 import json
+import mmap
+import struct
 from typing import Any, Dict
 import zipfile
 
@@ -23,7 +25,8 @@ class Base:
                  archive: zipfile.ZipFile,
                  index: Dict[str, Any],
                  proc: list[Dict[str, Any]],
-                 writable: bool) -> None:
+                 writable: bool,
+                 mapping: (mmap.mmap | None) = None) -> None:
         """
         Construct a new base object.
 
@@ -34,6 +37,8 @@ class Base:
             on if Canv or Ims).
             proc: Proc structure.
             writable: Flag to tell whether the file is writable.
+            mapping: Optional memory mapping the archive is read from. Is
+            closed together with the archive.
         """
         assert is_canv_index(index) or is_ims_index(index)
         assert is_proc(proc)
@@ -42,20 +47,80 @@ class Base:
         self._index = index
         self._proc = proc
         self._writable = writable
+        self._mapping = mapping
+
+        # Format for the numeric member names, same as util.nth_file but
+        # with the digit count computed once per file.
+        digits = len(str(index['frame-count']))
+        self._name_fmt = f'{{:0{digits}d}}'
+
+    def __enter__(self: Base) -> Base:
+        return self
+
+    def __exit__(self: Base, *args: Any) -> None:
+        self.close()
 
     def __del__(self: Base) -> None:
         """
-        Deletion method, to make sure the archive is closed. And that
-        metadata is written to archive if the file is writable.
+        Deletion method, a fallback to make sure the archive is closed
+        (see close). Prefer close, or a with statement, since the deletion
+        can happen late or - at interpreter shutdown - not work at all.
+        """
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def close(self: Base) -> None:
+        """
+        Close the archive. If the file is writable the index and proc are
+        first written to the archive - once, when the file is closed, and
+        not as a part of any other operation. Closing an already closed
+        object has no effect.
         """
         if self._archive is not None:
             if self._writable:
                 self._archive.writestr(
-                    'index.json', json.dumps(self._index, indent=2))
+                    'index.json', json.dumps(self._index, indent=2),
+                    compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
                 self._archive.writestr(
-                    'proc.json', json.dumps(self._proc, indent=2))
+                    'proc.json', json.dumps(self._proc, indent=2),
+                    compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
 
             self._archive.close()
+            self._archive = None
+
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def _read_member(self: Base, name: str) -> bytes:
+        """
+        Read a member from the archive. Uncompressed members are sliced
+        directly from the memory mapping, which avoids the zip-file's
+        stream machinery (and its CRC check). Other members, or archives
+        without a mapping, are read through the zip-file.
+
+        Parameters:
+            name: The member name.
+
+        Returns:
+            The member data.
+        """
+        info = self._archive.getinfo(name)
+        if self._mapping is not None and \
+                info.compress_type == zipfile.ZIP_STORED and \
+                not info.flag_bits & 0x1:
+            # The data follows the 30 byte local file header, and the
+            # header's variable length name and extra fields.
+            offset = info.header_offset
+            if self._mapping[offset:offset + 4] == b'PK\x03\x04':
+                name_length, extra_length = struct.unpack_from(
+                    '<HH', self._mapping, offset + 26)
+                start = offset + 30 + name_length + extra_length
+                return self._mapping[start:start + info.file_size]
+
+        return self._archive.read(name)
 
     def version(self: Base) -> int:
         """
@@ -1,13 +1,14 @@
 from __future__ import annotations  # noqa
 
 import json
+import mmap
 import pathlib
 from typing import Any, Dict
 import zipfile
 
 from .base import Base
 from .check import is_canv_index, is_metadata, is_proc
-from .util import nth_meta, with_exceptions
+from .util import map_file, nth_meta, with_exceptions
 
 
 class Canv(Base):
@@ -25,13 +26,15 @@ class Canv(Base):
             deep_validate: Flag to tell if deep validation shall be made.
 
         Returns:
-            The Canv object, or None if validation fails.
+            The Canv object, or None if validation fails. Use the object
+            in a with statement, or call close, to close the file.
         """
 
         def build_canv(path: pathlib.Path) -> (Canv | None):
             is_ok = True
 
-            archive = zipfile.ZipFile(path, mode='r')
+            mapping = map_file(path)
+            archive = zipfile.ZipFile(mapping, mode='r')
             index = json.loads(archive.read('index.json'))
             if not is_canv_index(index):
                 print(
@@ -53,16 +56,17 @@ class Canv(Base):
 
             if deep_validate:
                 frame_count = index['frame-count']
-                filelist = archive.namelist()
-                for frame_nr in range(frame_count):
-                    meta_name = nth_meta(frame_nr, frame_count)
-                    if not meta_name in filelist:
-                        print(f"Image '{meta_name}' is missing in '{path}'")
-                        is_ok = False
+                expected = frozenset(nth_meta(frame_nr, frame_count)
+                                     for frame_nr in range(frame_count))
+                missing = expected - frozenset(archive.namelist())
+                for meta_name in sorted(missing):
+                    print(f"Image '{meta_name}' is missing in '{path}'")
+                    is_ok = False
 
             if is_ok:
                 return Canv(archive=archive, index=index, proc=proc,
-                            writable=False, ims_path=ims_path)
+                            writable=False, ims_path=ims_path,
+                            mapping=mapping)
             else:
                 return None
 
@@ -82,7 +86,8 @@ class Canv(Base):
             frame_count: The number of frames for the file.
 
         Returns:
-            The Ims object.
+            The Ims object. Use the object in a with statement, or call close,
+            to write and close the file.
         """
         assert not ims_path.is_absolute()
 
@@ -100,11 +105,12 @@ class Canv(Base):
                  index: Dict[str, Any],
                  proc: list[Dict[str, Any]],
                  writable: bool,
-                 ims_path: pathlib.Path) -> None:
+                 ims_path: pathlib.Path,
+                 mapping: (mmap.mmap | None) = None) -> None:
         """
         Initialize a new Canv. Do not use Canv() directly, use from_file or new instead.
         """
-        super().__init__(archive, index, proc, writable)
+        super().__init__(archive, index, proc, writable, mapping)
         self._ims_path = ims_path
         self._frame_nr = 0
 
@@ -141,8 +147,33 @@ class Canv(Base):
         assert is_metadata(obj)
 
         if self._frame_nr < self.frame_count():
-            json_name = nth_meta(self._frame_nr, self.frame_count())
-            self._archive.writestr(json_name, json.dumps(obj, indent=2))
+            json_name = self._name_fmt.format(self._frame_nr) + '.json'
+            # Metadata is written compact, which lets json use its C encoder
+            # (any indent falls back to the pure Python encoder).
+            self._archive.writestr(
+                json_name, json.dumps(obj, separators=(',', ':')))
+            self._frame_nr += 1
+
+            return True
+        else:
+            return False
+
+    def append_raw(self: Canv, data: bytes) -> bool:
+        """
+        Append new JSON encoded metadata to the Canv-object, without
+        decoding or checking it. Is only valid for writable objects.
+
+        Parameters:
+            data: The JSON encoded metadata, e.g. from Canv.read_raw.
+
+        Returns:
+            True if the append was successful (i.e. within the frame count range).
+        """
+        assert self._writable
+
+        if self._frame_nr < self.frame_count():
+            json_name = self._name_fmt.format(self._frame_nr) + '.json'
+            self._archive.writestr(json_name, data)
             self._frame_nr += 1
 
             return True
@@ -163,7 +194,26 @@ class Canv(Base):
         assert not self._writable
 
         if index < self.frame_count():
-            json_name = nth_meta(index, self.frame_count())
-            return json.loads(self._archive.read(json_name))
+            json_name = self._name_fmt.format(index) + '.json'
+            return json.loads(self._read_member(json_name))
+        else:
+            return None
+
+    def read_raw(self: Canv, index: int) -> (bytes | None):
+        """
+        Read the indexed metadata item from the Canv-object, without
+        decoding it. Is only valid for non writable objects.
+
+        Parameters:
+            index: The requested index.
+
+        Returns:
+            The JSON encoded metadata if successful, else None.
+        """
+        assert not self._writable
+
+        if index < self.frame_count():
+            json_name = self._name_fmt.format(index) + '.json'
+            return self._read_member(json_name)
         else:
             return None
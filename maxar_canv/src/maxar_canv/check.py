@@ -42,13 +42,36 @@ def is_list_of(xs: list[Any], exp_len: int, pred: Callable[[Any], bool]) -> bool
     Returns:
         True or False.
     """
-    is_ok = isinstance(xs, list) and len(xs) == exp_len
+    if not (isinstance(xs, list) and len(xs) == exp_len):
+        return False
+
+    for x in xs:
+        if not pred(x):
+            return False
+
+    return True
+
+
+def is_list_of_floats(xs: list[Any], exp_len: int) -> bool:
+    """
+    Check that a list is composed of floating point numbers. Same as
+    is_list_of with is_float, but without a function call per item.
+
+    Parameters:
+        xs: The list.
+        exp_len: The expected length.
 
-    if is_ok:
-        for x in xs:
-            is_ok &= pred(x)
+    Returns:
+        True or False.
+    """
+    if not (isinstance(xs, list) and len(xs) == exp_len):
+        return False
+
+    for x in xs:
+        if not isinstance(x, float):
+            return False
 
-    return is_ok
+    return True
 
 
 def is_canv_index(obj: Dict[str, Any]) -> bool:
@@ -62,14 +85,13 @@ def is_canv_index(obj: Dict[str, Any]) -> bool:
         True or False.
     """
     try:
-        is_ok = isinstance(obj['version'], int) and obj['version'] >= 4
-        is_ok &= is_positive_int(obj['frame-count'])
-        is_ok &= is_list_of(obj['image-size'], 2, is_positive_int)
+        if not (isinstance(obj['version'], int) and obj['version'] >= 4
+                and is_positive_int(obj['frame-count'])
+                and is_list_of(obj['image-size'], 2, is_positive_int)):
+            return False
 
         path = pathlib.Path(obj['canonic-video-path'])
-        is_ok &= not path.is_absolute() and path.suffix == '.ims'
-
-        return is_ok
+        return not path.is_absolute() and path.suffix == '.ims'
     except KeyError:
         return False
     except TypeError:
@@ -87,10 +109,8 @@ def is_ims_index(obj: Dict[str, Any]) -> bool:
         True or False.
     """
     try:
-        is_ok = isinstance(obj['version'], int) and obj['version'] >= 4
-        is_ok &= is_positive_int(obj['frame-count'])
-
-        return is_ok
+        return (isinstance(obj['version'], int) and obj['version'] >= 4
+                and is_positive_int(obj['frame-count']))
     except KeyError:
         return False
     except TypeError:
@@ -108,14 +128,15 @@ def is_proc(objs: list[Dict[str, Any]]) -> bool:
         True or False.
     """
     try:
-        is_ok = isinstance(objs, list)
+        if not isinstance(objs, list):
+            return False
 
-        if is_ok and len(objs) > 0:
-            for obj in objs:
-                is_ok &= isinstance(obj['cmds'], list)
-                is_ok &= isinstance(obj['pwin'], str)
+        for obj in objs:
+            if not (isinstance(obj['cmds'], list)
+                    and isinstance(obj['pwin'], str)):
+                return False
 
-        return is_ok
+        return True
     except KeyError:
         return False
     except TypeError:
@@ -134,22 +155,15 @@ def is_metadata(obj: Dict[str, Any]) -> bool:
     """
     try:
         cam = obj['cam']
-
-        is_ok = is_list_of(cam['pos'], 3, is_float)
-        is_ok &= is_list_of(cam['att'], 3, is_float)
+        if not (is_list_of_floats(cam['pos'], 3)
+                and is_list_of_floats(cam['att'], 3)):
+            return False
 
         lens = cam['lens']
-        is_ok &= is_float(lens['vfov'])
-        is_ok &= is_float(lens['hfov'])
-
-        if 'k2' in lens:
-            is_ok &= is_float(lens['k2'])
-        if 'k3' in lens:
-            is_ok &= is_float(lens['k3'])
-        if 'k4' in lens:
-            is_ok &= is_float(lens['k4'])
-
-        return is_ok
+        return (is_float(lens['vfov']) and is_float(lens['hfov'])
+                and ('k2' not in lens or is_float(lens['k2']))
+                and ('k3' not in lens or is_float(lens['k3']))
+                and ('k4' not in lens or is_float(lens['k4'])))
     except KeyError:
         return False
     except TypeError:
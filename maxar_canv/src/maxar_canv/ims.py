@@ -1,6 +1,8 @@
 from __future__ import annotations  # noqa
 
+import io
 import json
+import mmap
 import pathlib
 from PIL import Image
 from typing import Any, Dict
@@ -8,7 +10,7 @@ import zipfile
 
 from .base import Base
 from .check import is_ims_index, is_proc
-from .util import nth_image, with_exceptions
+from .util import map_file, nth_image, with_exceptions
 
 
 class Ims(Base):
@@ -26,13 +28,15 @@ class Ims(Base):
             deep_validate: Flag to tell if deep validation shall be made.
 
         Returns:
-            The Ims object, or None if validation fails.
+            The Ims object, or None if validation fails. Use the object
+            in a with statement, or call close, to close the file.
         """
 
         def build_ims(path: pathlib.Path) -> (Ims | None):
             is_ok = True
 
-            archive = zipfile.ZipFile(path, mode='r')
+            mapping = map_file(path)
+            archive = zipfile.ZipFile(mapping, mode='r')
             index = json.loads(archive.read('index.json'))
             if not is_ims_index(index):
                 print(
@@ -47,15 +51,16 @@ class Ims(Base):
 
             if deep_validate:
                 frame_count = index['frame-count']
-                filelist = archive.namelist()
-                for frame_nr in range(frame_count):
-                    jpeg_name = nth_image(frame_nr, frame_count)
-                    if not jpeg_name in filelist:
-                        print(f"Image '{jpeg_name}' is missing in '{path}'")
-                        is_ok = False
+                expected = frozenset(nth_image(frame_nr, frame_count)
+                                     for frame_nr in range(frame_count))
+                missing = expected - frozenset(archive.namelist())
+                for jpeg_name in sorted(missing):
+                    print(f"Image '{jpeg_name}' is missing in '{path}'")
+                    is_ok = False
 
             if is_ok:
-                return Ims(archive=archive, index=index, proc=proc, writable=False)
+                return Ims(archive=archive, index=index, proc=proc,
+                           writable=False, mapping=mapping)
             else:
                 return None
 
@@ -71,7 +76,8 @@ class Ims(Base):
             frame_count: The number of frames for the file.
 
         Returns:
-            The Ims object.
+            The Ims object. Use the object in a with statement, or call close,
+            to write and close the file.
         """
         archive = zipfile.ZipFile(path, mode='w')
         index = {
@@ -84,13 +90,17 @@ class Ims(Base):
                  archive: zipfile.ZipFile,
                  index: Dict[str, Any],
                  proc: list[Dict[str, Any]],
-                 writable: bool) -> None:
+                 writable: bool,
+                 mapping: (mmap.mmap | None) = None) -> None:
         """
         Initialize a new Ims. Do not use Ims() directly, use from_file or new instead.
         """
-        super().__init__(archive, index, proc, writable)
+        super().__init__(archive, index, proc, writable, mapping)
         self._frame_nr = 0
 
+        # Buffer for Ims.append, reused (and only grown) between frames.
+        self._encode_buffer = io.BytesIO() if writable else None
+
     def append(self: Ims, image: Image.Image) -> bool:
         """
         Append a new Image to the Ims-object. Is only valid for writable
@@ -106,16 +116,65 @@ class Ims(Base):
         assert isinstance(image, Image.Image)
 
         if self._frame_nr < self.frame_count():
-            jpeg_name = nth_image(self._frame_nr, self.frame_count())
-            with self._archive.open(jpeg_name, 'w') as file:
-                image.save(
-                    file, 'jpeg', icc_profile=image.info.get('icc_profile'))
+            # Encode into the start of the reused buffer, and let the archive
+            # read the encoded image directly from the buffer, without first
+            # copying it to a bytes object.
+            buffer = self._encode_buffer
+            buffer.seek(0)
+            Ims._encode(image, buffer)
+            with buffer.getbuffer() as view, view[:buffer.tell()] as data:
+                return self.append_raw(data)
+        else:
+            return False
+
+    def append_raw(self: Ims, data: bytes) -> bool:
+        """
+        Append a new JPEG encoded image to the Ims-object. Is only valid
+        for writable objects.
+
+        Parameters:
+            data: The JPEG encoded image, e.g. from Ims.encode.
+
+        Returns:
+            True if the append was successful (i.e. within the frame count range).
+        """
+        assert self._writable
+
+        if self._frame_nr < self.frame_count():
+            jpeg_name = self._name_fmt.format(self._frame_nr) + '.jpeg'
+            # JPEG data is already entropy coded, so it is always stored
+            # uncompressed - deflate would only cost time.
+            self._archive.writestr(
+                jpeg_name, data, compress_type=zipfile.ZIP_STORED)
             self._frame_nr += 1
 
             return True
         else:
             return False
 
+    @staticmethod
+    def encode(image: Image.Image) -> bytes:
+        """
+        Encode an image the same way as Ims.append is doing. Can be called
+        from any thread, and the result is appended using Ims.append_raw.
+
+        Parameters:
+            image: A PIL image.
+
+        Returns:
+            The JPEG encoded image.
+        """
+        assert isinstance(image, Image.Image)
+
+        buffer = io.BytesIO()
+        Ims._encode(image, buffer)
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _encode(image: Image.Image, buffer: io.BytesIO) -> None:
+        image.save(buffer, 'jpeg', icc_profile=image.info.get('icc_profile'))
+
     def read(self: Ims, index: int) -> (Image.Image | None):
         """
         Read the indexed image from the Ims-object. Is only
@@ -130,7 +189,52 @@ class Ims(Base):
         assert not self._writable
 
         if index < self.frame_count():
-            jpeg_name = nth_image(index, self.frame_count())
-            return Image.open(self._archive.open(jpeg_name, 'r'), formats=['jpeg'])
+            # Read the complete member in one go, rather than letting the
+            # JPEG decoder pull many small chunks through the zip-file.
+            jpeg_name = self._name_fmt.format(index) + '.jpeg'
+            data = io.BytesIO(self._read_member(jpeg_name))
+            return Image.open(data, formats=['jpeg'])
         else:
             return None
+
+    def read_raw(self: Ims, index: int) -> (bytes | None):
+        """
+        Read the indexed image from the Ims-object, without decoding it.
+        Is only valid for non writable objects.
+
+        Parameters:
+            index: The requested index.
+
+        Returns:
+            The JPEG encoded image if successful, else None.
+        """
+        assert not self._writable
+
+        if index < self.frame_count():
+            jpeg_name = self._name_fmt.format(index) + '.jpeg'
+            return self._read_member(jpeg_name)
+        else:
+            return None
+
+    def read_scaled(self: Ims, index: int, size: tuple[int, int]) -> (Image.Image | None):
+        """
+        Read the indexed image from the Ims-object, scaled to the given size.
+        As much as possible of the downscaling is made by the JPEG decoder
+        (in steps of 1/2, 1/4 or 1/8), and only the remainder by a resize,
+        which itself starts with a fast integer reduction for large factors.
+        Is only valid for non writable objects.
+
+        Parameters:
+            index: The requested index.
+            size: The requested image size (width, height).
+
+        Returns:
+            The PIL Image if successful, else None.
+        """
+        image = self.read(index)
+        if image is not None:
+            image.draft(image.mode, size)
+            if image.size != tuple(size):
+                image = image.resize(size, reducing_gap=2.0)
+
+        return image
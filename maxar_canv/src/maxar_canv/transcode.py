@@ -0,0 +1,56 @@
+from __future__ import annotations  # noqa
+
+import pathlib
+
+from .canv import Canv
+from .ims import Ims
+
+# The source files opened by each worker process. Set by init_transcoder.
+_canv: (Canv | None) = None
+_ims: (Ims | None) = None
+_image_size: (tuple[int, int] | None) = None
+
+
+def init_transcoder(canv_path: pathlib.Path,
+                    image_size: (tuple[int, int] | None)) -> None:
+    """
+    Initializer for a worker process transcoding frames. Opens the worker's
+    own Canv-file and Ims-file, so no archives are shared between processes.
+
+    Parameters:
+        canv_path: The source Canv-file path.
+        image_size: The image size (width, height) for the transcoded images.
+                    If None the original image size is used.
+    """
+    global _canv, _ims, _image_size
+
+    _canv = Canv.from_file(canv_path)
+    _ims = Ims.from_file(_canv.ims_path()) if _canv is not None else None
+    _image_size = image_size
+
+
+def transcode_frame(frame_nr: int) -> (tuple[bytes, bytes] | None):
+    """
+    Read, decode, scale and encode a frame in a worker process initialized
+    with init_transcoder.
+
+    Parameters:
+        frame_nr: The frame number.
+
+    Returns:
+        A tuple with the JSON encoded metadata and the JPEG encoded image,
+        or None if the frame cannot be read.
+    """
+    if _canv is None or _ims is None:
+        return None
+
+    meta = _canv.read_raw(frame_nr)
+    if _image_size is None:
+        image = _ims.read(frame_nr)
+    else:
+        image = _ims.read_scaled(frame_nr, _image_size)
+
+    if not meta is None and not image is None:
+        return meta, Ims.encode(image)
+    else:
+        return None
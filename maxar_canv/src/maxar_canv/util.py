@@ -1,6 +1,6 @@
 from __future__ import annotations  # noqa
 
-import math
+import mmap
 import pathlib
 from typing import Any, Callable
 import zipfile
@@ -20,7 +20,7 @@ def nth_file(num: int, count: int, suffix: str) -> str:
     """
     assert num <= count
 
-    digits = math.floor(math.log10(count)) + 1
+    digits = len(str(count))
     return str(num).zfill(digits) + suffix
 
 
@@ -52,6 +52,30 @@ def nth_image(num: int, count: int) -> str:
     return nth_file(num, count, '.jpeg')
 
 
+class MappedFile(mmap.mmap):
+    """
+    Memory mapped file, which can be used as a file object by zipfile
+    (mmap itself only got seekable in Python 3.13).
+    """
+
+    def seekable(self: MappedFile) -> bool:
+        return True
+
+
+def map_file(path: pathlib.Path) -> MappedFile:
+    """
+    Utility to memory map a file for reading.
+
+    Parameters:
+        path: The path to the file (must not be empty).
+
+    Returns:
+        The read only memory mapping of the file.
+    """
+    with open(path, 'rb') as file:
+        return MappedFile(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def with_exceptions(path: pathlib.Path, f: Callable[[pathlib.Path], Any]) -> Any:
     """
     Helper function to wrap exceptions while reading a zip archive.
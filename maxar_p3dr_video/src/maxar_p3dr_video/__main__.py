@@ -1,6 +1,7 @@
 from __future__ import annotations  # noqa
 
 import argparse
+from google.protobuf.internal import api_implementation
 import os
 import pathlib
 import sys
@@ -74,6 +75,11 @@ def main() -> bool:
                         help="Threshold for the max number of simultaneous frames in flight")
     opts = parser.parse_args()
 
+    # The native protobuf implementations (upb or cpp) are used by default
+    # when available, and are much faster than the pure Python one.
+    if api_implementation.Type() == 'python':
+        print('Warning: The slow pure Python protobuf implementation is used')
+
     # Check that the input file exists.
     input_file = opts.canv.absolute()
     if not input_file.is_file():
@@ -106,20 +112,16 @@ def main() -> bool:
         print('Output file cannot be the same as the input file')
         return False
 
-    # Open the input Canv video as a Playback.
-    input_video = Playback.from_file(input_file)
-    if input_video is None:
+    # Open the input Canv video as a Playback. The frames are decoded and
+    # converted to grayscale by the registrator.
+    playback = Playback.from_file(input_file)
+    if playback is None:
         return False
 
     # Get the relative path for the Ims file.
-    abs_ims_path = input_video._canv.ims_path()
+    abs_ims_path = playback._canv.ims_path()
     rel_ims_path = pathlib.Path(os.path.relpath(abs_ims_path, output_file.parent))
 
-    # Create playback object for the input video.
-    playback = Playback.from_file(input_file)
-    if playback is None:
-        return False
-
     # Create the new registered Canv-file.
     reg_canv = Canv.new(path=output_file,
                         frame_count=playback._canv.frame_count(),
@@ -1,12 +1,21 @@
 from __future__ import annotations  # noqa
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import pathlib
 from PIL import Image
+import threading
 from typing import Any, Dict
 
 from maxar_canv import Canv, Playback
 from .server import Server
 
+# Sentinel for the end of a playback.
+_END = object()
+
+# The max number of registration requests sent at once.
+_MAX_BATCH = 8
+
 
 class CanvRegistrator():
     """
@@ -25,8 +34,15 @@ class CanvRegistrator():
         self._server = server
         self._max_in_flight = max_in_flight
         self._stream_id = -1
-        self._active_frames = dict()
+        self._active_frames = deque()
+        self._frames_by_id = dict()
         self._canv = None
+        self._condition = threading.Condition()
+        self._in_flight = None
+        self._converter = None
+        self._pushed_all = False
+        self._push_error = None
+        self._stopped = False
 
         url = self._server.url()
         version = self._server.query_version()
@@ -48,56 +64,162 @@ class CanvRegistrator():
         self._stream_id = self._server.open_stream(references=references)
         print(f'Stream #{self._stream_id} is opened')
 
-        self._active_frames = dict()
+        # The active frames in frame order, and the same frames by id.
+        self._active_frames = deque()
+        self._frames_by_id = dict()
         self._canv = canv
+        self._in_flight = threading.Semaphore(self._max_in_flight)
+        self._pushed_all = False
+        self._push_error = None
+        self._stopped = False
+
+        # Push all the data from the playback in a producer thread, and
+        # simultaneously handle responses in this thread. The semaphore
+        # makes sure that the max number in flight never is exceeded.
+        # The producer uses a small thread pool to decode and convert the
+        # frames to grayscale, overlapping with the sending.
+        self._converter = ThreadPoolExecutor(max_workers=2)
+        producer = threading.Thread(target=self._push_requests,
+                                    args=(playback,))
+        producer.start()
+
+        try:
+            while True:
+                with self._condition:
+                    while len(self._active_frames) == 0 and not self._pushed_all:
+                        self._condition.wait()
+
+                    # Stop waiting for responses if the producer failed, and
+                    # raise its error here instead.
+                    if self._push_error is not None:
+                        raise self._push_error
+
+                    if len(self._active_frames) == 0:
+                        break
 
-        # Push all the data from the playback ...
-        for request_id, data in enumerate(playback):
-            self._push_request(frame_id=request_id, data=data)
-
-            # ... and simultaneously handle responses so that the
-            # max number in flight never is exceeded.
-            while len(self._active_frames) >= self._max_in_flight:
                 self._pop_response()
-
-        # Wait for the last few frames.
-        while len(self._active_frames) > 0:
-            self._pop_response()
+        finally:
+            # Unblock the producer if stopping early.
+            self._stopped = True
+            for _ in range(self._max_in_flight):
+                self._in_flight.release()
+
+            producer.join()
+            self._converter.shutdown()
+
+    def _push_requests(self: CanvRegistrator, playback: Playback) -> None:
+        try:
+            frames = iter(playback)
+            pending = deque()
+            request_id = 0
+            while True:
+                # Take a slot before reading the next frame, so that no more
+                # than the max number in flight frames are held at a time.
+                # While there are frames being converted, push them instead
+                # of waiting for a slot.
+                while not self._in_flight.acquire(blocking=len(pending) == 0):
+                    self._push_pending(pending)
+
+                if self._stopped:
+                    break
+
+                data = next(frames, _END)
+                if data is _END:
+                    break
+
+                # Convert the frame while pushing the previous frames.
+                metadata, image = data
+                pending.append((request_id, metadata['cam'],
+                                self._converter.submit(_to_grayscale, image)))
+                data = image = None  # Do not hold the image while waiting.
+                request_id += 1
+
+                # Push the oldest frame once the next one is submitted, or
+                # as soon as it is converted, so that the conversion of the
+                # next frame overlaps with the sending.
+                if len(pending) > 1 or pending[0][2].done():
+                    self._push_pending(pending)
+
+            while len(pending) > 0 and not self._stopped:
+                self._push_pending(pending)
+        except BaseException as e:
+            with self._condition:
+                self._push_error = e
+        finally:
+            with self._condition:
+                self._pushed_all = True
+                self._condition.notify()
+
+    def _push_pending(self: CanvRegistrator, pending: deque) -> None:
+        # Push the oldest pending frame, together with the following frames
+        # that already are converted, and send them all at once.
+        count = 1
+        while count < min(len(pending), _MAX_BATCH) and pending[count][2].done():
+            count += 1
+
+        for _ in range(count):
+            self._push_request(*pending.popleft())
+
+        self._server.flush()
 
     def _push_request(self: CanvRegistrator, frame_id: int,
-                      data: tuple[Dict[str, Any], Image.Image]) -> None:
-        metadata, image = data
-        camera = metadata['cam']
-
-        if self._server.request_registration(stream_id=self._stream_id,
-                                             frame_id=frame_id,
-                                             camera=camera,
-                                             image=image):
-            assert frame_id not in self._active_frames
-            self._active_frames[frame_id] = {
+                      camera: Dict[str, Any], image: Future) -> None:
+        # The request is only queued here, and is sent by the following
+        # flush. The frame is made active after the request is queued, so
+        # that a failing conversion never leaves an active frame without a
+        # request, but before it is sent, since the response can arrive as
+        # soon as it is sent.
+        if not self._server.request_registration(stream_id=self._stream_id,
+                                                 frame_id=frame_id,
+                                                 camera=camera,
+                                                 image=image.result(),
+                                                 flush=False):
+            self._in_flight.release()
+            return
+
+        with self._condition:
+            assert frame_id not in self._frames_by_id
+            frame = {
+                'frame_id': frame_id,
                 'camera': camera,
                 'received': False
             }
+            self._active_frames.append(frame)
+            self._frames_by_id[frame_id] = frame
+            self._condition.notify()
 
     def _pop_response(self: CanvRegistrator) -> None:
         result = self._server.get_registration_result()
-        if result is not None:
-            frame_id, fom, camera, err_msg = result
-            assert frame_id in self._active_frames
-            if camera is not None:
-                self._active_frames[frame_id] = {
-                    'camera': camera,
-                    'received': True
+
+        with self._condition:
+            if result is not None:
+                frame_id, fom, camera, err_msg = result
+                frame = self._frames_by_id[frame_id]
+                frame['received'] = True
+                if camera is not None:
+                    frame['camera'] = camera
+                    print(f'Frame #{frame_id} received with FOM={fom:.2f}')
+                else:
+                    print(f'Frame #{frame_id} received with error={err_msg}')
+
+            # Write all the received frames at the front, in frame order.
+            while len(self._active_frames) > 0 and self._active_frames[0]['received']:
+                frame = self._active_frames.popleft()
+                del self._frames_by_id[frame['frame_id']]
+
+                metadata = {
+                    'cam': frame['camera']
                 }
-                print(f'Frame #{frame_id} received with FOM={fom:.2f}')
-            else:
-                self._active_frames[frame_id]['received'] = True
-                print(f'Frame #{frame_id} received with error={err_msg}')
-
-        earliest_id = list(self._active_frames)[0]
-        if self._active_frames[earliest_id]['received']:
-            metadata = {
-                'cam': self._active_frames[earliest_id]['camera']
-            }
-            self._canv.append(metadata)
-            del self._active_frames[earliest_id]
+                self._canv.append(metadata)
+                self._in_flight.release()
+
+
+def _to_grayscale(image: Image.Image) -> Image.Image:
+    # The same conversion as in request_registration, which then has
+    # nothing left to do.
+    if image.mode != 'L':
+        image = image.convert('L')
+
+    image.load()
+
+    return image
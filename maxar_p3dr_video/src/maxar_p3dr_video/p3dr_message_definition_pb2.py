@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: p3dr_message_definition.proto
+# Protobuf Python Version: 4.25.1
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -13,1517 +14,66 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='p3dr_message_definition.proto',
-  package='p3dr.video.proto',
-  syntax='proto3',
-  serialized_options=b'\n\032com.maxar.p3dr.video.protoB\017P3DRFrameProtos',
-  create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x1dp3dr_message_definition.proto\x12\x10p3dr.video.proto\"\xcc\x03\n\x0bUserMessage\x12\x38\n\x07request\x18\x01 \x01(\x0b\x32%.p3dr.video.proto.RegistrationRequestH\x00\x12N\n\x18\x61\x63tivateApiLogIndication\x18\n \x01(\x0b\x32*.p3dr.video.proto.ActivateApiLogIndicationH\x00\x12R\n\x1a\x64\x65\x61\x63tivateApiLogIndication\x18\x0b \x01(\x0b\x32,.p3dr.video.proto.DeactivateApiLogIndicationH\x00\x12@\n\x11openStreamRequest\x18\x0c \x01(\x0b\x32#.p3dr.video.proto.OpenStreamRequestH\x00\x12:\n\x0eversionRequest\x18\r \x01(\x0b\x32 .p3dr.video.proto.VersionRequestH\x00\x12V\n\x1clistReferenceDatasetsRequest\x18\x0e \x01(\x0b\x32..p3dr.video.proto.ListReferenceDatasetsRequestH\x00\x42\t\n\x07message\"\x96\x03\n\x0bP3DRMessage\x12:\n\x08response\x18\x02 \x01(\x0b\x32&.p3dr.video.proto.RegistrationResponseH\x00\x12\x34\n\x05\x65rror\x18\x03 \x01(\x0b\x32#.p3dr.video.proto.RegistrationErrorH\x00\x12.\n\x08\x61piError\x18\x04 \x01(\x0b\x32\x1a.p3dr.video.proto.ApiErrorH\x00\x12\x42\n\x12openStreamResponse\x18\x05 \x01(\x0b\x32$.p3dr.video.proto.OpenStreamResponseH\x00\x12<\n\x0fversionResponse\x18\x06 \x01(\x0b\x32!.p3dr.video.proto.VersionResponseH\x00\x12X\n\x1dlistReferenceDatasetsResponse\x18\x07 \x01(\x0b\x32/.p3dr.video.proto.ListReferenceDatasetsResponseH\x00\x42\t\n\x07message\"b\n\x13RegistrationRequest\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\x04\x12&\n\x05\x66rame\x18\x03 \x01(\x0b\x32\x17.p3dr.video.proto.Frame\"-\n\x18\x41\x63tivateApiLogIndication\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"/\n\x1a\x44\x65\x61\x63tivateApiLogIndication\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"/\n\x11OpenStreamRequest\x12\x1a\n\x12reference_datasets\x18\x01 \x03(\t\"\x10\n\x0eVersionRequest\"1\n\x1cListReferenceDatasetsRequest\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"\xc4\x01\n\x14RegistrationResponse\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\x04\x12\x17\n\x0f\x66igure_of_merit\x18\x03 \x01(\x01\x12\x31\n\x08metadata\x18\x04 \x01(\x0b\x32\x1f.p3dr.video.proto.ImageMetadata\x12;\n\x10geo_registration\x18\x05 \x01(\x0b\x32!.p3dr.video.proto.GeoRegistration\"\x80\x03\n\x11RegistrationError\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\x04\x12\x41\n\nerror_type\x18\x03 \x01(\x0e\x32-.p3dr.video.proto.RegistrationError.ErrorType\x12\x14\n\x0c\x65rror_string\x18\x04 \x01(\t\"\xec\x01\n\tErrorType\x12\x11\n\rMISSING_FRAME\x10\x00\x12\x14\n\x10MISSING_METADATA\x10\x01\x12\x11\n\rMISSING_IMAGE\x10\x02\x12#\n\x1fINVALID_INPUT_COORDINATE_SYSTEM\x10\x03\x12\x1e\n\x1aINTERNAL_FAIL_CREATE_IMAGE\x10\x04\x12#\n\x1fINTERNAL_FAIL_CREATE_PROJECTION\x10\x05\x12\x1e\n\x1aINTERNAL_FAIL_REGISTRATION\x10\x06\x12\x19\n\x15NO_REFERENCE_DATASETS\x10\x07\"\x83\x01\n\x08\x41piError\x12\x38\n\nerror_type\x18\x01 \x01(\x0e\x32$.p3dr.video.proto.ApiError.ErrorType\"=\n\tErrorType\x12\x15\n\x11INVALID_STREAM_ID\x10\x00\x12\x19\n\x15NO_REFERENCE_DATASETS\x10\x01\"\'\n\x12OpenStreamResponse\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"3\n\x0fVersionResponse\x12\x0e\n\x06\x62ranch\x18\x01 \x01(\t\x12\x10\n\x08revision\x18\x02 \x01(\t\"N\n\x1dListReferenceDatasetsResponse\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x1a\n\x12reference_datasets\x18\x02 \x03(\t\"\xe2\x01\n\x05\x46rame\x12\x31\n\x08metadata\x18\x01 \x01(\x0b\x32\x1f.p3dr.video.proto.ImageMetadata\x12/\n\trgb_image\x18\n \x01(\x0b\x32\x1a.p3dr.video.proto.RgbImageH\x00\x12/\n\tpng_image\x18\x0b \x01(\x0b\x32\x1a.p3dr.video.proto.PngImageH\x00\x12;\n\x0fgrayscale_image\x18\x0c \x01(\x0b\x32 .p3dr.video.proto.GrayscaleImageH\x00\x42\x07\n\x05image\"<\n\x05Point\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x0e\n\x06height\x18\x03 \x01(\x01\"4\n\x08\x41ttitude\x12\x0b\n\x03yaw\x18\x01 \x01(\x01\x12\r\n\x05pitch\x18\x02 \x01(\x01\x12\x0c\n\x04roll\x18\x03 \x01(\x01\"3\n\x0b\x46ieldOfView\x12\x12\n\nhorizontal\x18\x01 \x01(\x01\x12\x10\n\x08vertical\x18\x02 \x01(\x01\"4\n\x0eLensParameters\x12\n\n\x02k2\x18\x01 \x01(\x01\x12\n\n\x02k3\x18\x02 \x01(\x01\x12\n\n\x02k4\x18\x03 \x01(\x01\"\xcf\x01\n\rImageMetadata\x12)\n\x08position\x18\x01 \x01(\x0b\x32\x17.p3dr.video.proto.Point\x12,\n\x08\x61ttitude\x18\x02 \x01(\x0b\x32\x1a.p3dr.video.proto.Attitude\x12*\n\x03\x66ov\x18\x03 \x01(\x0b\x32\x1d.p3dr.video.proto.FieldOfView\x12\x39\n\x0flens_parameters\x18\x04 \x01(\x0b\x32 .p3dr.video.proto.LensParameters\"\xb8\x01\n\x0fGeoRegistration\x12O\n\x12\x65\x61rth_intersection\x18\x01 \x03(\x0b\x32\x33.p3dr.video.proto.GeoRegistration.EarthIntersection\x1aT\n\x11\x45\x61rthIntersection\x12\t\n\x01u\x18\x01 \x01(\x01\x12\t\n\x01v\x18\x02 \x01(\x01\x12)\n\x08location\x18\x03 \x01(\x0b\x32\x17.p3dr.video.proto.Point\"Q\n\x08RgbImage\x12\r\n\x05width\x18\x01 \x01(\r\x12\x0e\n\x06height\x18\x02 \x01(\r\x12\r\n\x03raw\x18\x03 \x01(\x0cH\x00\x12\x0e\n\x04path\x18\x04 \x01(\tH\x00\x42\x07\n\x05\x62ytes\"W\n\x0eGrayscaleImage\x12\r\n\x05width\x18\x01 \x01(\r\x12\x0e\n\x06height\x18\x02 \x01(\r\x12\r\n\x03raw\x18\x03 \x01(\x0cH\x00\x12\x0e\n\x04path\x18\x04 \x01(\tH\x00\x42\x07\n\x05\x62ytes\"2\n\x08PngImage\x12\r\n\x03raw\x18\x01 \x01(\x0cH\x00\x12\x0e\n\x04path\x18\x02 \x01(\tH\x00\x42\x07\n\x05\x62ytesB-\n\x1a\x63om.maxar.p3dr.video.protoB\x0fP3DRFrameProtosb\x06proto3'
-)
-
-
-
-_REGISTRATIONERROR_ERRORTYPE = _descriptor.EnumDescriptor(
-  name='ErrorType',
-  full_name='p3dr.video.proto.RegistrationError.ErrorType',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='MISSING_FRAME', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='MISSING_METADATA', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='MISSING_IMAGE', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='INVALID_INPUT_COORDINATE_SYSTEM', index=3, number=3,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='INTERNAL_FAIL_CREATE_IMAGE', index=4, number=4,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='INTERNAL_FAIL_CREATE_PROJECTION', index=5, number=5,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='INTERNAL_FAIL_REGISTRATION', index=6, number=6,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='NO_REFERENCE_DATASETS', index=7, number=7,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1585,
-  serialized_end=1821,
-)
-_sym_db.RegisterEnumDescriptor(_REGISTRATIONERROR_ERRORTYPE)
-
-_APIERROR_ERRORTYPE = _descriptor.EnumDescriptor(
-  name='ErrorType',
-  full_name='p3dr.video.proto.ApiError.ErrorType',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='INVALID_STREAM_ID', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='NO_REFERENCE_DATASETS', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1894,
-  serialized_end=1955,
-)
-_sym_db.RegisterEnumDescriptor(_APIERROR_ERRORTYPE)
-
-
-_USERMESSAGE = _descriptor.Descriptor(
-  name='UserMessage',
-  full_name='p3dr.video.proto.UserMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='request', full_name='p3dr.video.proto.UserMessage.request', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='activateApiLogIndication', full_name='p3dr.video.proto.UserMessage.activateApiLogIndication', index=1,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='deactivateApiLogIndication', full_name='p3dr.video.proto.UserMessage.deactivateApiLogIndication', index=2,
-      number=11, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='openStreamRequest', full_name='p3dr.video.proto.UserMessage.openStreamRequest', index=3,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='versionRequest', full_name='p3dr.video.proto.UserMessage.versionRequest', index=4,
-      number=13, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='listReferenceDatasetsRequest', full_name='p3dr.video.proto.UserMessage.listReferenceDatasetsRequest', index=5,
-      number=14, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='message', full_name='p3dr.video.proto.UserMessage.message',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=52,
-  serialized_end=512,
-)
-
-
-_P3DRMESSAGE = _descriptor.Descriptor(
-  name='P3DRMessage',
-  full_name='p3dr.video.proto.P3DRMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='response', full_name='p3dr.video.proto.P3DRMessage.response', index=0,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='error', full_name='p3dr.video.proto.P3DRMessage.error', index=1,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='apiError', full_name='p3dr.video.proto.P3DRMessage.apiError', index=2,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='openStreamResponse', full_name='p3dr.video.proto.P3DRMessage.openStreamResponse', index=3,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='versionResponse', full_name='p3dr.video.proto.P3DRMessage.versionResponse', index=4,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='listReferenceDatasetsResponse', full_name='p3dr.video.proto.P3DRMessage.listReferenceDatasetsResponse', index=5,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='message', full_name='p3dr.video.proto.P3DRMessage.message',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=515,
-  serialized_end=921,
-)
-
-
-_REGISTRATIONREQUEST = _descriptor.Descriptor(
-  name='RegistrationRequest',
-  full_name='p3dr.video.proto.RegistrationRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.RegistrationRequest.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='frame_id', full_name='p3dr.video.proto.RegistrationRequest.frame_id', index=1,
-      number=2, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='frame', full_name='p3dr.video.proto.RegistrationRequest.frame', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=923,
-  serialized_end=1021,
-)
-
-
-_ACTIVATEAPILOGINDICATION = _descriptor.Descriptor(
-  name='ActivateApiLogIndication',
-  full_name='p3dr.video.proto.ActivateApiLogIndication',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.ActivateApiLogIndication.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1023,
-  serialized_end=1068,
-)
-
-
-_DEACTIVATEAPILOGINDICATION = _descriptor.Descriptor(
-  name='DeactivateApiLogIndication',
-  full_name='p3dr.video.proto.DeactivateApiLogIndication',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.DeactivateApiLogIndication.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1070,
-  serialized_end=1117,
-)
-
-
-_OPENSTREAMREQUEST = _descriptor.Descriptor(
-  name='OpenStreamRequest',
-  full_name='p3dr.video.proto.OpenStreamRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='reference_datasets', full_name='p3dr.video.proto.OpenStreamRequest.reference_datasets', index=0,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1119,
-  serialized_end=1166,
-)
-
-
-_VERSIONREQUEST = _descriptor.Descriptor(
-  name='VersionRequest',
-  full_name='p3dr.video.proto.VersionRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1168,
-  serialized_end=1184,
-)
-
-
-_LISTREFERENCEDATASETSREQUEST = _descriptor.Descriptor(
-  name='ListReferenceDatasetsRequest',
-  full_name='p3dr.video.proto.ListReferenceDatasetsRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.ListReferenceDatasetsRequest.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1186,
-  serialized_end=1235,
-)
-
-
-_REGISTRATIONRESPONSE = _descriptor.Descriptor(
-  name='RegistrationResponse',
-  full_name='p3dr.video.proto.RegistrationResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.RegistrationResponse.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='frame_id', full_name='p3dr.video.proto.RegistrationResponse.frame_id', index=1,
-      number=2, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='figure_of_merit', full_name='p3dr.video.proto.RegistrationResponse.figure_of_merit', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='metadata', full_name='p3dr.video.proto.RegistrationResponse.metadata', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='geo_registration', full_name='p3dr.video.proto.RegistrationResponse.geo_registration', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1238,
-  serialized_end=1434,
-)
-
-
-_REGISTRATIONERROR = _descriptor.Descriptor(
-  name='RegistrationError',
-  full_name='p3dr.video.proto.RegistrationError',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.RegistrationError.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='frame_id', full_name='p3dr.video.proto.RegistrationError.frame_id', index=1,
-      number=2, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='error_type', full_name='p3dr.video.proto.RegistrationError.error_type', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='error_string', full_name='p3dr.video.proto.RegistrationError.error_string', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _REGISTRATIONERROR_ERRORTYPE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1437,
-  serialized_end=1821,
-)
-
-
-_APIERROR = _descriptor.Descriptor(
-  name='ApiError',
-  full_name='p3dr.video.proto.ApiError',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='error_type', full_name='p3dr.video.proto.ApiError.error_type', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _APIERROR_ERRORTYPE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1824,
-  serialized_end=1955,
-)
-
-
-_OPENSTREAMRESPONSE = _descriptor.Descriptor(
-  name='OpenStreamResponse',
-  full_name='p3dr.video.proto.OpenStreamResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.OpenStreamResponse.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1957,
-  serialized_end=1996,
-)
-
-
-_VERSIONRESPONSE = _descriptor.Descriptor(
-  name='VersionResponse',
-  full_name='p3dr.video.proto.VersionResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='branch', full_name='p3dr.video.proto.VersionResponse.branch', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='revision', full_name='p3dr.video.proto.VersionResponse.revision', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1998,
-  serialized_end=2049,
-)
-
-
-_LISTREFERENCEDATASETSRESPONSE = _descriptor.Descriptor(
-  name='ListReferenceDatasetsResponse',
-  full_name='p3dr.video.proto.ListReferenceDatasetsResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='stream_id', full_name='p3dr.video.proto.ListReferenceDatasetsResponse.stream_id', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='reference_datasets', full_name='p3dr.video.proto.ListReferenceDatasetsResponse.reference_datasets', index=1,
-      number=2, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2051,
-  serialized_end=2129,
-)
-
-
-_FRAME = _descriptor.Descriptor(
-  name='Frame',
-  full_name='p3dr.video.proto.Frame',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='metadata', full_name='p3dr.video.proto.Frame.metadata', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='rgb_image', full_name='p3dr.video.proto.Frame.rgb_image', index=1,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='png_image', full_name='p3dr.video.proto.Frame.png_image', index=2,
-      number=11, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='grayscale_image', full_name='p3dr.video.proto.Frame.grayscale_image', index=3,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='image', full_name='p3dr.video.proto.Frame.image',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=2132,
-  serialized_end=2358,
-)
-
-
-_POINT = _descriptor.Descriptor(
-  name='Point',
-  full_name='p3dr.video.proto.Point',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='latitude', full_name='p3dr.video.proto.Point.latitude', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='longitude', full_name='p3dr.video.proto.Point.longitude', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='p3dr.video.proto.Point.height', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2360,
-  serialized_end=2420,
-)
-
-
-_ATTITUDE = _descriptor.Descriptor(
-  name='Attitude',
-  full_name='p3dr.video.proto.Attitude',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='yaw', full_name='p3dr.video.proto.Attitude.yaw', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='pitch', full_name='p3dr.video.proto.Attitude.pitch', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='roll', full_name='p3dr.video.proto.Attitude.roll', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2422,
-  serialized_end=2474,
-)
-
-
-_FIELDOFVIEW = _descriptor.Descriptor(
-  name='FieldOfView',
-  full_name='p3dr.video.proto.FieldOfView',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='horizontal', full_name='p3dr.video.proto.FieldOfView.horizontal', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='vertical', full_name='p3dr.video.proto.FieldOfView.vertical', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2476,
-  serialized_end=2527,
-)
-
-
-_LENSPARAMETERS = _descriptor.Descriptor(
-  name='LensParameters',
-  full_name='p3dr.video.proto.LensParameters',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='k2', full_name='p3dr.video.proto.LensParameters.k2', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='k3', full_name='p3dr.video.proto.LensParameters.k3', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='k4', full_name='p3dr.video.proto.LensParameters.k4', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2529,
-  serialized_end=2581,
-)
-
-
-_IMAGEMETADATA = _descriptor.Descriptor(
-  name='ImageMetadata',
-  full_name='p3dr.video.proto.ImageMetadata',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='position', full_name='p3dr.video.proto.ImageMetadata.position', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='attitude', full_name='p3dr.video.proto.ImageMetadata.attitude', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='fov', full_name='p3dr.video.proto.ImageMetadata.fov', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='lens_parameters', full_name='p3dr.video.proto.ImageMetadata.lens_parameters', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2584,
-  serialized_end=2791,
-)
-
-
-_GEOREGISTRATION_EARTHINTERSECTION = _descriptor.Descriptor(
-  name='EarthIntersection',
-  full_name='p3dr.video.proto.GeoRegistration.EarthIntersection',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='u', full_name='p3dr.video.proto.GeoRegistration.EarthIntersection.u', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='v', full_name='p3dr.video.proto.GeoRegistration.EarthIntersection.v', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='location', full_name='p3dr.video.proto.GeoRegistration.EarthIntersection.location', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2894,
-  serialized_end=2978,
-)
-
-_GEOREGISTRATION = _descriptor.Descriptor(
-  name='GeoRegistration',
-  full_name='p3dr.video.proto.GeoRegistration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='earth_intersection', full_name='p3dr.video.proto.GeoRegistration.earth_intersection', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[_GEOREGISTRATION_EARTHINTERSECTION, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2794,
-  serialized_end=2978,
-)
-
-
-_RGBIMAGE = _descriptor.Descriptor(
-  name='RgbImage',
-  full_name='p3dr.video.proto.RgbImage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='width', full_name='p3dr.video.proto.RgbImage.width', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='p3dr.video.proto.RgbImage.height', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='raw', full_name='p3dr.video.proto.RgbImage.raw', index=2,
-      number=3, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='path', full_name='p3dr.video.proto.RgbImage.path', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='bytes', full_name='p3dr.video.proto.RgbImage.bytes',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=2980,
-  serialized_end=3061,
-)
-
-
-_GRAYSCALEIMAGE = _descriptor.Descriptor(
-  name='GrayscaleImage',
-  full_name='p3dr.video.proto.GrayscaleImage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='width', full_name='p3dr.video.proto.GrayscaleImage.width', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='p3dr.video.proto.GrayscaleImage.height', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='raw', full_name='p3dr.video.proto.GrayscaleImage.raw', index=2,
-      number=3, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='path', full_name='p3dr.video.proto.GrayscaleImage.path', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='bytes', full_name='p3dr.video.proto.GrayscaleImage.bytes',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=3063,
-  serialized_end=3150,
-)
-
-
-_PNGIMAGE = _descriptor.Descriptor(
-  name='PngImage',
-  full_name='p3dr.video.proto.PngImage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='raw', full_name='p3dr.video.proto.PngImage.raw', index=0,
-      number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='path', full_name='p3dr.video.proto.PngImage.path', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='bytes', full_name='p3dr.video.proto.PngImage.bytes',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=3152,
-  serialized_end=3202,
-)
-
-_USERMESSAGE.fields_by_name['request'].message_type = _REGISTRATIONREQUEST
-_USERMESSAGE.fields_by_name['activateApiLogIndication'].message_type = _ACTIVATEAPILOGINDICATION
-_USERMESSAGE.fields_by_name['deactivateApiLogIndication'].message_type = _DEACTIVATEAPILOGINDICATION
-_USERMESSAGE.fields_by_name['openStreamRequest'].message_type = _OPENSTREAMREQUEST
-_USERMESSAGE.fields_by_name['versionRequest'].message_type = _VERSIONREQUEST
-_USERMESSAGE.fields_by_name['listReferenceDatasetsRequest'].message_type = _LISTREFERENCEDATASETSREQUEST
-_USERMESSAGE.oneofs_by_name['message'].fields.append(
-  _USERMESSAGE.fields_by_name['request'])
-_USERMESSAGE.fields_by_name['request'].containing_oneof = _USERMESSAGE.oneofs_by_name['message']
-_USERMESSAGE.oneofs_by_name['message'].fields.append(
-  _USERMESSAGE.fields_by_name['activateApiLogIndication'])
-_USERMESSAGE.fields_by_name['activateApiLogIndication'].containing_oneof = _USERMESSAGE.oneofs_by_name['message']
-_USERMESSAGE.oneofs_by_name['message'].fields.append(
-  _USERMESSAGE.fields_by_name['deactivateApiLogIndication'])
-_USERMESSAGE.fields_by_name['deactivateApiLogIndication'].containing_oneof = _USERMESSAGE.oneofs_by_name['message']
-_USERMESSAGE.oneofs_by_name['message'].fields.append(
-  _USERMESSAGE.fields_by_name['openStreamRequest'])
-_USERMESSAGE.fields_by_name['openStreamRequest'].containing_oneof = _USERMESSAGE.oneofs_by_name['message']
-_USERMESSAGE.oneofs_by_name['message'].fields.append(
-  _USERMESSAGE.fields_by_name['versionRequest'])
-_USERMESSAGE.fields_by_name['versionRequest'].containing_oneof = _USERMESSAGE.oneofs_by_name['message']
-_USERMESSAGE.oneofs_by_name['message'].fields.append(
-  _USERMESSAGE.fields_by_name['listReferenceDatasetsRequest'])
-_USERMESSAGE.fields_by_name['listReferenceDatasetsRequest'].containing_oneof = _USERMESSAGE.oneofs_by_name['message']
-_P3DRMESSAGE.fields_by_name['response'].message_type = _REGISTRATIONRESPONSE
-_P3DRMESSAGE.fields_by_name['error'].message_type = _REGISTRATIONERROR
-_P3DRMESSAGE.fields_by_name['apiError'].message_type = _APIERROR
-_P3DRMESSAGE.fields_by_name['openStreamResponse'].message_type = _OPENSTREAMRESPONSE
-_P3DRMESSAGE.fields_by_name['versionResponse'].message_type = _VERSIONRESPONSE
-_P3DRMESSAGE.fields_by_name['listReferenceDatasetsResponse'].message_type = _LISTREFERENCEDATASETSRESPONSE
-_P3DRMESSAGE.oneofs_by_name['message'].fields.append(
-  _P3DRMESSAGE.fields_by_name['response'])
-_P3DRMESSAGE.fields_by_name['response'].containing_oneof = _P3DRMESSAGE.oneofs_by_name['message']
-_P3DRMESSAGE.oneofs_by_name['message'].fields.append(
-  _P3DRMESSAGE.fields_by_name['error'])
-_P3DRMESSAGE.fields_by_name['error'].containing_oneof = _P3DRMESSAGE.oneofs_by_name['message']
-_P3DRMESSAGE.oneofs_by_name['message'].fields.append(
-  _P3DRMESSAGE.fields_by_name['apiError'])
-_P3DRMESSAGE.fields_by_name['apiError'].containing_oneof = _P3DRMESSAGE.oneofs_by_name['message']
-_P3DRMESSAGE.oneofs_by_name['message'].fields.append(
-  _P3DRMESSAGE.fields_by_name['openStreamResponse'])
-_P3DRMESSAGE.fields_by_name['openStreamResponse'].containing_oneof = _P3DRMESSAGE.oneofs_by_name['message']
-_P3DRMESSAGE.oneofs_by_name['message'].fields.append(
-  _P3DRMESSAGE.fields_by_name['versionResponse'])
-_P3DRMESSAGE.fields_by_name['versionResponse'].containing_oneof = _P3DRMESSAGE.oneofs_by_name['message']
-_P3DRMESSAGE.oneofs_by_name['message'].fields.append(
-  _P3DRMESSAGE.fields_by_name['listReferenceDatasetsResponse'])
-_P3DRMESSAGE.fields_by_name['listReferenceDatasetsResponse'].containing_oneof = _P3DRMESSAGE.oneofs_by_name['message']
-_REGISTRATIONREQUEST.fields_by_name['frame'].message_type = _FRAME
-_REGISTRATIONRESPONSE.fields_by_name['metadata'].message_type = _IMAGEMETADATA
-_REGISTRATIONRESPONSE.fields_by_name['geo_registration'].message_type = _GEOREGISTRATION
-_REGISTRATIONERROR.fields_by_name['error_type'].enum_type = _REGISTRATIONERROR_ERRORTYPE
-_REGISTRATIONERROR_ERRORTYPE.containing_type = _REGISTRATIONERROR
-_APIERROR.fields_by_name['error_type'].enum_type = _APIERROR_ERRORTYPE
-_APIERROR_ERRORTYPE.containing_type = _APIERROR
-_FRAME.fields_by_name['metadata'].message_type = _IMAGEMETADATA
-_FRAME.fields_by_name['rgb_image'].message_type = _RGBIMAGE
-_FRAME.fields_by_name['png_image'].message_type = _PNGIMAGE
-_FRAME.fields_by_name['grayscale_image'].message_type = _GRAYSCALEIMAGE
-_FRAME.oneofs_by_name['image'].fields.append(
-  _FRAME.fields_by_name['rgb_image'])
-_FRAME.fields_by_name['rgb_image'].containing_oneof = _FRAME.oneofs_by_name['image']
-_FRAME.oneofs_by_name['image'].fields.append(
-  _FRAME.fields_by_name['png_image'])
-_FRAME.fields_by_name['png_image'].containing_oneof = _FRAME.oneofs_by_name['image']
-_FRAME.oneofs_by_name['image'].fields.append(
-  _FRAME.fields_by_name['grayscale_image'])
-_FRAME.fields_by_name['grayscale_image'].containing_oneof = _FRAME.oneofs_by_name['image']
-_IMAGEMETADATA.fields_by_name['position'].message_type = _POINT
-_IMAGEMETADATA.fields_by_name['attitude'].message_type = _ATTITUDE
-_IMAGEMETADATA.fields_by_name['fov'].message_type = _FIELDOFVIEW
-_IMAGEMETADATA.fields_by_name['lens_parameters'].message_type = _LENSPARAMETERS
-_GEOREGISTRATION_EARTHINTERSECTION.fields_by_name['location'].message_type = _POINT
-_GEOREGISTRATION_EARTHINTERSECTION.containing_type = _GEOREGISTRATION
-_GEOREGISTRATION.fields_by_name['earth_intersection'].message_type = _GEOREGISTRATION_EARTHINTERSECTION
-_RGBIMAGE.oneofs_by_name['bytes'].fields.append(
-  _RGBIMAGE.fields_by_name['raw'])
-_RGBIMAGE.fields_by_name['raw'].containing_oneof = _RGBIMAGE.oneofs_by_name['bytes']
-_RGBIMAGE.oneofs_by_name['bytes'].fields.append(
-  _RGBIMAGE.fields_by_name['path'])
-_RGBIMAGE.fields_by_name['path'].containing_oneof = _RGBIMAGE.oneofs_by_name['bytes']
-_GRAYSCALEIMAGE.oneofs_by_name['bytes'].fields.append(
-  _GRAYSCALEIMAGE.fields_by_name['raw'])
-_GRAYSCALEIMAGE.fields_by_name['raw'].containing_oneof = _GRAYSCALEIMAGE.oneofs_by_name['bytes']
-_GRAYSCALEIMAGE.oneofs_by_name['bytes'].fields.append(
-  _GRAYSCALEIMAGE.fields_by_name['path'])
-_GRAYSCALEIMAGE.fields_by_name['path'].containing_oneof = _GRAYSCALEIMAGE.oneofs_by_name['bytes']
-_PNGIMAGE.oneofs_by_name['bytes'].fields.append(
-  _PNGIMAGE.fields_by_name['raw'])
-_PNGIMAGE.fields_by_name['raw'].containing_oneof = _PNGIMAGE.oneofs_by_name['bytes']
-_PNGIMAGE.oneofs_by_name['bytes'].fields.append(
-  _PNGIMAGE.fields_by_name['path'])
-_PNGIMAGE.fields_by_name['path'].containing_oneof = _PNGIMAGE.oneofs_by_name['bytes']
-DESCRIPTOR.message_types_by_name['UserMessage'] = _USERMESSAGE
-DESCRIPTOR.message_types_by_name['P3DRMessage'] = _P3DRMESSAGE
-DESCRIPTOR.message_types_by_name['RegistrationRequest'] = _REGISTRATIONREQUEST
-DESCRIPTOR.message_types_by_name['ActivateApiLogIndication'] = _ACTIVATEAPILOGINDICATION
-DESCRIPTOR.message_types_by_name['DeactivateApiLogIndication'] = _DEACTIVATEAPILOGINDICATION
-DESCRIPTOR.message_types_by_name['OpenStreamRequest'] = _OPENSTREAMREQUEST
-DESCRIPTOR.message_types_by_name['VersionRequest'] = _VERSIONREQUEST
-DESCRIPTOR.message_types_by_name['ListReferenceDatasetsRequest'] = _LISTREFERENCEDATASETSREQUEST
-DESCRIPTOR.message_types_by_name['RegistrationResponse'] = _REGISTRATIONRESPONSE
-DESCRIPTOR.message_types_by_name['RegistrationError'] = _REGISTRATIONERROR
-DESCRIPTOR.message_types_by_name['ApiError'] = _APIERROR
-DESCRIPTOR.message_types_by_name['OpenStreamResponse'] = _OPENSTREAMRESPONSE
-DESCRIPTOR.message_types_by_name['VersionResponse'] = _VERSIONRESPONSE
-DESCRIPTOR.message_types_by_name['ListReferenceDatasetsResponse'] = _LISTREFERENCEDATASETSRESPONSE
-DESCRIPTOR.message_types_by_name['Frame'] = _FRAME
-DESCRIPTOR.message_types_by_name['Point'] = _POINT
-DESCRIPTOR.message_types_by_name['Attitude'] = _ATTITUDE
-DESCRIPTOR.message_types_by_name['FieldOfView'] = _FIELDOFVIEW
-DESCRIPTOR.message_types_by_name['LensParameters'] = _LENSPARAMETERS
-DESCRIPTOR.message_types_by_name['ImageMetadata'] = _IMAGEMETADATA
-DESCRIPTOR.message_types_by_name['GeoRegistration'] = _GEOREGISTRATION
-DESCRIPTOR.message_types_by_name['RgbImage'] = _RGBIMAGE
-DESCRIPTOR.message_types_by_name['GrayscaleImage'] = _GRAYSCALEIMAGE
-DESCRIPTOR.message_types_by_name['PngImage'] = _PNGIMAGE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-UserMessage = _reflection.GeneratedProtocolMessageType('UserMessage', (_message.Message,), {
-  'DESCRIPTOR' : _USERMESSAGE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.UserMessage)
-  })
-_sym_db.RegisterMessage(UserMessage)
-
-P3DRMessage = _reflection.GeneratedProtocolMessageType('P3DRMessage', (_message.Message,), {
-  'DESCRIPTOR' : _P3DRMESSAGE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.P3DRMessage)
-  })
-_sym_db.RegisterMessage(P3DRMessage)
-
-RegistrationRequest = _reflection.GeneratedProtocolMessageType('RegistrationRequest', (_message.Message,), {
-  'DESCRIPTOR' : _REGISTRATIONREQUEST,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.RegistrationRequest)
-  })
-_sym_db.RegisterMessage(RegistrationRequest)
-
-ActivateApiLogIndication = _reflection.GeneratedProtocolMessageType('ActivateApiLogIndication', (_message.Message,), {
-  'DESCRIPTOR' : _ACTIVATEAPILOGINDICATION,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.ActivateApiLogIndication)
-  })
-_sym_db.RegisterMessage(ActivateApiLogIndication)
-
-DeactivateApiLogIndication = _reflection.GeneratedProtocolMessageType('DeactivateApiLogIndication', (_message.Message,), {
-  'DESCRIPTOR' : _DEACTIVATEAPILOGINDICATION,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.DeactivateApiLogIndication)
-  })
-_sym_db.RegisterMessage(DeactivateApiLogIndication)
-
-OpenStreamRequest = _reflection.GeneratedProtocolMessageType('OpenStreamRequest', (_message.Message,), {
-  'DESCRIPTOR' : _OPENSTREAMREQUEST,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.OpenStreamRequest)
-  })
-_sym_db.RegisterMessage(OpenStreamRequest)
-
-VersionRequest = _reflection.GeneratedProtocolMessageType('VersionRequest', (_message.Message,), {
-  'DESCRIPTOR' : _VERSIONREQUEST,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.VersionRequest)
-  })
-_sym_db.RegisterMessage(VersionRequest)
-
-ListReferenceDatasetsRequest = _reflection.GeneratedProtocolMessageType('ListReferenceDatasetsRequest', (_message.Message,), {
-  'DESCRIPTOR' : _LISTREFERENCEDATASETSREQUEST,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.ListReferenceDatasetsRequest)
-  })
-_sym_db.RegisterMessage(ListReferenceDatasetsRequest)
-
-RegistrationResponse = _reflection.GeneratedProtocolMessageType('RegistrationResponse', (_message.Message,), {
-  'DESCRIPTOR' : _REGISTRATIONRESPONSE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.RegistrationResponse)
-  })
-_sym_db.RegisterMessage(RegistrationResponse)
-
-RegistrationError = _reflection.GeneratedProtocolMessageType('RegistrationError', (_message.Message,), {
-  'DESCRIPTOR' : _REGISTRATIONERROR,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.RegistrationError)
-  })
-_sym_db.RegisterMessage(RegistrationError)
-
-ApiError = _reflection.GeneratedProtocolMessageType('ApiError', (_message.Message,), {
-  'DESCRIPTOR' : _APIERROR,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.ApiError)
-  })
-_sym_db.RegisterMessage(ApiError)
-
-OpenStreamResponse = _reflection.GeneratedProtocolMessageType('OpenStreamResponse', (_message.Message,), {
-  'DESCRIPTOR' : _OPENSTREAMRESPONSE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.OpenStreamResponse)
-  })
-_sym_db.RegisterMessage(OpenStreamResponse)
-
-VersionResponse = _reflection.GeneratedProtocolMessageType('VersionResponse', (_message.Message,), {
-  'DESCRIPTOR' : _VERSIONRESPONSE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.VersionResponse)
-  })
-_sym_db.RegisterMessage(VersionResponse)
-
-ListReferenceDatasetsResponse = _reflection.GeneratedProtocolMessageType('ListReferenceDatasetsResponse', (_message.Message,), {
-  'DESCRIPTOR' : _LISTREFERENCEDATASETSRESPONSE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.ListReferenceDatasetsResponse)
-  })
-_sym_db.RegisterMessage(ListReferenceDatasetsResponse)
-
-Frame = _reflection.GeneratedProtocolMessageType('Frame', (_message.Message,), {
-  'DESCRIPTOR' : _FRAME,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.Frame)
-  })
-_sym_db.RegisterMessage(Frame)
-
-Point = _reflection.GeneratedProtocolMessageType('Point', (_message.Message,), {
-  'DESCRIPTOR' : _POINT,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.Point)
-  })
-_sym_db.RegisterMessage(Point)
-
-Attitude = _reflection.GeneratedProtocolMessageType('Attitude', (_message.Message,), {
-  'DESCRIPTOR' : _ATTITUDE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.Attitude)
-  })
-_sym_db.RegisterMessage(Attitude)
-
-FieldOfView = _reflection.GeneratedProtocolMessageType('FieldOfView', (_message.Message,), {
-  'DESCRIPTOR' : _FIELDOFVIEW,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.FieldOfView)
-  })
-_sym_db.RegisterMessage(FieldOfView)
-
-LensParameters = _reflection.GeneratedProtocolMessageType('LensParameters', (_message.Message,), {
-  'DESCRIPTOR' : _LENSPARAMETERS,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.LensParameters)
-  })
-_sym_db.RegisterMessage(LensParameters)
-
-ImageMetadata = _reflection.GeneratedProtocolMessageType('ImageMetadata', (_message.Message,), {
-  'DESCRIPTOR' : _IMAGEMETADATA,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.ImageMetadata)
-  })
-_sym_db.RegisterMessage(ImageMetadata)
-
-GeoRegistration = _reflection.GeneratedProtocolMessageType('GeoRegistration', (_message.Message,), {
-
-  'EarthIntersection' : _reflection.GeneratedProtocolMessageType('EarthIntersection', (_message.Message,), {
-    'DESCRIPTOR' : _GEOREGISTRATION_EARTHINTERSECTION,
-    '__module__' : 'p3dr_message_definition_pb2'
-    # @@protoc_insertion_point(class_scope:p3dr.video.proto.GeoRegistration.EarthIntersection)
-    })
-  ,
-  'DESCRIPTOR' : _GEOREGISTRATION,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.GeoRegistration)
-  })
-_sym_db.RegisterMessage(GeoRegistration)
-_sym_db.RegisterMessage(GeoRegistration.EarthIntersection)
-
-RgbImage = _reflection.GeneratedProtocolMessageType('RgbImage', (_message.Message,), {
-  'DESCRIPTOR' : _RGBIMAGE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.RgbImage)
-  })
-_sym_db.RegisterMessage(RgbImage)
-
-GrayscaleImage = _reflection.GeneratedProtocolMessageType('GrayscaleImage', (_message.Message,), {
-  'DESCRIPTOR' : _GRAYSCALEIMAGE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.GrayscaleImage)
-  })
-_sym_db.RegisterMessage(GrayscaleImage)
-
-PngImage = _reflection.GeneratedProtocolMessageType('PngImage', (_message.Message,), {
-  'DESCRIPTOR' : _PNGIMAGE,
-  '__module__' : 'p3dr_message_definition_pb2'
-  # @@protoc_insertion_point(class_scope:p3dr.video.proto.PngImage)
-  })
-_sym_db.RegisterMessage(PngImage)
-
-
-DESCRIPTOR._options = None
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dp3dr_message_definition.proto\x12\x10p3dr.video.proto\"\xcc\x03\n\x0bUserMessage\x12\x38\n\x07request\x18\x01 \x01(\x0b\x32%.p3dr.video.proto.RegistrationRequestH\x00\x12N\n\x18\x61\x63tivateApiLogIndication\x18\n \x01(\x0b\x32*.p3dr.video.proto.ActivateApiLogIndicationH\x00\x12R\n\x1a\x64\x65\x61\x63tivateApiLogIndication\x18\x0b \x01(\x0b\x32,.p3dr.video.proto.DeactivateApiLogIndicationH\x00\x12@\n\x11openStreamRequest\x18\x0c \x01(\x0b\x32#.p3dr.video.proto.OpenStreamRequestH\x00\x12:\n\x0eversionRequest\x18\r \x01(\x0b\x32 .p3dr.video.proto.VersionRequestH\x00\x12V\n\x1clistReferenceDatasetsRequest\x18\x0e \x01(\x0b\x32..p3dr.video.proto.ListReferenceDatasetsRequestH\x00\x42\t\n\x07message\"\x96\x03\n\x0bP3DRMessage\x12:\n\x08response\x18\x02 \x01(\x0b\x32&.p3dr.video.proto.RegistrationResponseH\x00\x12\x34\n\x05\x65rror\x18\x03 \x01(\x0b\x32#.p3dr.video.proto.RegistrationErrorH\x00\x12.\n\x08\x61piError\x18\x04 \x01(\x0b\x32\x1a.p3dr.video.proto.ApiErrorH\x00\x12\x42\n\x12openStreamResponse\x18\x05 \x01(\x0b\x32$.p3dr.video.proto.OpenStreamResponseH\x00\x12<\n\x0fversionResponse\x18\x06 \x01(\x0b\x32!.p3dr.video.proto.VersionResponseH\x00\x12X\n\x1dlistReferenceDatasetsResponse\x18\x07 \x01(\x0b\x32/.p3dr.video.proto.ListReferenceDatasetsResponseH\x00\x42\t\n\x07message\"b\n\x13RegistrationRequest\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\x04\x12&\n\x05\x66rame\x18\x03 \x01(\x0b\x32\x17.p3dr.video.proto.Frame\"-\n\x18\x41\x63tivateApiLogIndication\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"/\n\x1a\x44\x65\x61\x63tivateApiLogIndication\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"/\n\x11OpenStreamRequest\x12\x1a\n\x12reference_datasets\x18\x01 \x03(\t\"\x10\n\x0eVersionRequest\"1\n\x1cListReferenceDatasetsRequest\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"\xc4\x01\n\x14RegistrationResponse\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\x04\x12\x17\n\x0f\x66igure_of_merit\x18\x03 \x01(\x01\x12\x31\n\x08metadata\x18\x04 \x01(\x0b\x32\x1f.p3dr.video.proto.ImageMetadata\x12;\n\x10geo_registration\x18\x05 \x01(\x0b\x32!.p3dr.video.proto.GeoRegistration\"\x80\x03\n\x11RegistrationError\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\x04\x12\x41\n\nerror_type\x18\x03 \x01(\x0e\x32-.p3dr.video.proto.RegistrationError.ErrorType\x12\x14\n\x0c\x65rror_string\x18\x04 \x01(\t\"\xec\x01\n\tErrorType\x12\x11\n\rMISSING_FRAME\x10\x00\x12\x14\n\x10MISSING_METADATA\x10\x01\x12\x11\n\rMISSING_IMAGE\x10\x02\x12#\n\x1fINVALID_INPUT_COORDINATE_SYSTEM\x10\x03\x12\x1e\n\x1aINTERNAL_FAIL_CREATE_IMAGE\x10\x04\x12#\n\x1fINTERNAL_FAIL_CREATE_PROJECTION\x10\x05\x12\x1e\n\x1aINTERNAL_FAIL_REGISTRATION\x10\x06\x12\x19\n\x15NO_REFERENCE_DATASETS\x10\x07\"\x83\x01\n\x08\x41piError\x12\x38\n\nerror_type\x18\x01 \x01(\x0e\x32$.p3dr.video.proto.ApiError.ErrorType\"=\n\tErrorType\x12\x15\n\x11INVALID_STREAM_ID\x10\x00\x12\x19\n\x15NO_REFERENCE_DATASETS\x10\x01\"\'\n\x12OpenStreamResponse\x12\x11\n\tstream_id\x18\x01 \x01(\x04\"3\n\x0fVersionResponse\x12\x0e\n\x06\x62ranch\x18\x01 \x01(\t\x12\x10\n\x08revision\x18\x02 \x01(\t\"N\n\x1dListReferenceDatasetsResponse\x12\x11\n\tstream_id\x18\x01 \x01(\x04\x12\x1a\n\x12reference_datasets\x18\x02 \x03(\t\"\xe2\x01\n\x05\x46rame\x12\x31\n\x08metadata\x18\x01 \x01(\x0b\x32\x1f.p3dr.video.proto.ImageMetadata\x12/\n\trgb_image\x18\n \x01(\x0b\x32\x1a.p3dr.video.proto.RgbImageH\x00\x12/\n\tpng_image\x18\x0b \x01(\x0b\x32\x1a.p3dr.video.proto.PngImageH\x00\x12;\n\x0fgrayscale_image\x18\x0c \x01(\x0b\x32 .p3dr.video.proto.GrayscaleImageH\x00\x42\x07\n\x05image\"<\n\x05Point\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x0e\n\x06height\x18\x03 \x01(\x01\"4\n\x08\x41ttitude\x12\x0b\n\x03yaw\x18\x01 \x01(\x01\x12\r\n\x05pitch\x18\x02 \x01(\x01\x12\x0c\n\x04roll\x18\x03 \x01(\x01\"3\n\x0b\x46ieldOfView\x12\x12\n\nhorizontal\x18\x01 \x01(\x01\x12\x10\n\x08vertical\x18\x02 \x01(\x01\"4\n\x0eLensParameters\x12\n\n\x02k2\x18\x01 \x01(\x01\x12\n\n\x02k3\x18\x02 \x01(\x01\x12\n\n\x02k4\x18\x03 \x01(\x01\"\xcf\x01\n\rImageMetadata\x12)\n\x08position\x18\x01 \x01(\x0b\x32\x17.p3dr.video.proto.Point\x12,\n\x08\x61ttitude\x18\x02 \x01(\x0b\x32\x1a.p3dr.video.proto.Attitude\x12*\n\x03\x66ov\x18\x03 \x01(\x0b\x32\x1d.p3dr.video.proto.FieldOfView\x12\x39\n\x0flens_parameters\x18\x04 \x01(\x0b\x32 .p3dr.video.proto.LensParameters\"\xb8\x01\n\x0fGeoRegistration\x12O\n\x12\x65\x61rth_intersection\x18\x01 \x03(\x0b\x32\x33.p3dr.video.proto.GeoRegistration.EarthIntersection\x1aT\n\x11\x45\x61rthIntersection\x12\t\n\x01u\x18\x01 \x01(\x01\x12\t\n\x01v\x18\x02 \x01(\x01\x12)\n\x08location\x18\x03 \x01(\x0b\x32\x17.p3dr.video.proto.Point\"Q\n\x08RgbImage\x12\r\n\x05width\x18\x01 \x01(\r\x12\x0e\n\x06height\x18\x02 \x01(\r\x12\r\n\x03raw\x18\x03 \x01(\x0cH\x00\x12\x0e\n\x04path\x18\x04 \x01(\tH\x00\x42\x07\n\x05\x62ytes\"W\n\x0eGrayscaleImage\x12\r\n\x05width\x18\x01 \x01(\r\x12\x0e\n\x06height\x18\x02 \x01(\r\x12\r\n\x03raw\x18\x03 \x01(\x0cH\x00\x12\x0e\n\x04path\x18\x04 \x01(\tH\x00\x42\x07\n\x05\x62ytes\"2\n\x08PngImage\x12\r\n\x03raw\x18\x01 \x01(\x0cH\x00\x12\x0e\n\x04path\x18\x02 \x01(\tH\x00\x42\x07\n\x05\x62ytesB-\n\x1a\x63om.maxar.p3dr.video.protoB\x0fP3DRFrameProtosb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'p3dr_message_definition_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  _globals['DESCRIPTOR']._options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\032com.maxar.p3dr.video.protoB\017P3DRFrameProtos'
+  _globals['_USERMESSAGE']._serialized_start=52
+  _globals['_USERMESSAGE']._serialized_end=512
+  _globals['_P3DRMESSAGE']._serialized_start=515
+  _globals['_P3DRMESSAGE']._serialized_end=921
+  _globals['_REGISTRATIONREQUEST']._serialized_start=923
+  _globals['_REGISTRATIONREQUEST']._serialized_end=1021
+  _globals['_ACTIVATEAPILOGINDICATION']._serialized_start=1023
+  _globals['_ACTIVATEAPILOGINDICATION']._serialized_end=1068
+  _globals['_DEACTIVATEAPILOGINDICATION']._serialized_start=1070
+  _globals['_DEACTIVATEAPILOGINDICATION']._serialized_end=1117
+  _globals['_OPENSTREAMREQUEST']._serialized_start=1119
+  _globals['_OPENSTREAMREQUEST']._serialized_end=1166
+  _globals['_VERSIONREQUEST']._serialized_start=1168
+  _globals['_VERSIONREQUEST']._serialized_end=1184
+  _globals['_LISTREFERENCEDATASETSREQUEST']._serialized_start=1186
+  _globals['_LISTREFERENCEDATASETSREQUEST']._serialized_end=1235
+  _globals['_REGISTRATIONRESPONSE']._serialized_start=1238
+  _globals['_REGISTRATIONRESPONSE']._serialized_end=1434
+  _globals['_REGISTRATIONERROR']._serialized_start=1437
+  _globals['_REGISTRATIONERROR']._serialized_end=1821
+  _globals['_REGISTRATIONERROR_ERRORTYPE']._serialized_start=1585
+  _globals['_REGISTRATIONERROR_ERRORTYPE']._serialized_end=1821
+  _globals['_APIERROR']._serialized_start=1824
+  _globals['_APIERROR']._serialized_end=1955
+  _globals['_APIERROR_ERRORTYPE']._serialized_start=1894
+  _globals['_APIERROR_ERRORTYPE']._serialized_end=1955
+  _globals['_OPENSTREAMRESPONSE']._serialized_start=1957
+  _globals['_OPENSTREAMRESPONSE']._serialized_end=1996
+  _globals['_VERSIONRESPONSE']._serialized_start=1998
+  _globals['_VERSIONRESPONSE']._serialized_end=2049
+  _globals['_LISTREFERENCEDATASETSRESPONSE']._serialized_start=2051
+  _globals['_LISTREFERENCEDATASETSRESPONSE']._serialized_end=2129
+  _globals['_FRAME']._serialized_start=2132
+  _globals['_FRAME']._serialized_end=2358
+  _globals['_POINT']._serialized_start=2360
+  _globals['_POINT']._serialized_end=2420
+  _globals['_ATTITUDE']._serialized_start=2422
+  _globals['_ATTITUDE']._serialized_end=2474
+  _globals['_FIELDOFVIEW']._serialized_start=2476
+  _globals['_FIELDOFVIEW']._serialized_end=2527
+  _globals['_LENSPARAMETERS']._serialized_start=2529
+  _globals['_LENSPARAMETERS']._serialized_end=2581
+  _globals['_IMAGEMETADATA']._serialized_start=2584
+  _globals['_IMAGEMETADATA']._serialized_end=2791
+  _globals['_GEOREGISTRATION']._serialized_start=2794
+  _globals['_GEOREGISTRATION']._serialized_end=2978
+  _globals['_GEOREGISTRATION_EARTHINTERSECTION']._serialized_start=2894
+  _globals['_GEOREGISTRATION_EARTHINTERSECTION']._serialized_end=2978
+  _globals['_RGBIMAGE']._serialized_start=2980
+  _globals['_RGBIMAGE']._serialized_end=3061
+  _globals['_GRAYSCALEIMAGE']._serialized_start=3063
+  _globals['_GRAYSCALEIMAGE']._serialized_end=3150
+  _globals['_PNGIMAGE']._serialized_start=3152
+  _globals['_PNGIMAGE']._serialized_end=3202
 # @@protoc_insertion_point(module_scope)
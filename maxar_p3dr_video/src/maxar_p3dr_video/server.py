@@ -1,10 +1,12 @@
 from __future__ import annotations  # noqa
 
-from .socket import create_and_connect, receive_payload, send_payload
+from .socket import create_and_connect, create_selector, receive_payload, \
+    send_payloads
 import maxar_p3dr_video.p3dr_message_definition_pb2 as pb
 
 import json
 import math
+import os
 import pathlib
 from PIL import Image
 import subprocess
@@ -12,6 +14,47 @@ import tempfile
 import time
 from typing import Any, Dict
 
+# Factors for converting radians to degrees and vice versa. The same as
+# math.degrees and math.radians, without a function call per value.
+_DEG = 180.0 / math.pi
+_RAD = math.pi / 180.0
+
+# The interval in seconds for polling the address file of a private server.
+_ADDRESS_POLL_INTERVAL = 0.02
+
+
+def _pack_camera(metadata: pb.ImageMetadata, camera: Dict[str, Any]) -> None:
+    """
+    Pack canonic camera metadata into a protobuf metadata message, with
+    a fixed sequence of field stores.
+
+    Parameters:
+        metadata: The metadata message to assign.
+        camera: Dictionary with canonic camera metadata.
+    """
+    pos = camera['pos']
+    att = camera['att']
+    lens = camera['lens']
+
+    position = metadata.position
+    position.latitude = pos[0]
+    position.longitude = pos[1]
+    position.height = pos[2]
+
+    attitude = metadata.attitude
+    attitude.yaw = att[0] * _DEG
+    attitude.pitch = att[1] * _DEG
+    attitude.roll = att[2] * _DEG
+
+    fov = metadata.fov
+    fov.horizontal = lens['hfov'] * _DEG
+    fov.vertical = lens['vfov'] * _DEG
+
+    lens_parameters = metadata.lens_parameters
+    lens_parameters.k2 = lens.get('k2', 0.0)
+    lens_parameters.k3 = lens.get('k3', 0.0)
+    lens_parameters.k4 = lens.get('k4', 0.0)
+
 
 class Server():
     """
@@ -27,9 +70,23 @@ class Server():
         'private_server()' instead.
         """
         self._socket = None
+        self._selector = None
         self._server_proc = None
         self._url = None
 
+        # Buffer for received payloads, grown on demand, and the message
+        # they are parsed into.
+        self._rx_buf = bytearray(64 * 1024)
+        self._rx_msg = pb.P3DRMessage()
+
+        # The message used for registration requests. It is reused between
+        # requests, which all assign the same set of fields.
+        self._req_msg = pb.UserMessage()
+        self._req_msg.request.SetInParent()
+
+        # Serialized messages waiting to be sent by flush.
+        self._tx_payloads = list()
+
     @staticmethod
     def public_server(host: str, port: int) -> Server:
         """
@@ -44,6 +101,7 @@ class Server():
         """
         self = Server()
         self._socket = create_and_connect(host, port)
+        self._selector = create_selector(self._socket)
         self._url = f'tcp://{host}:{port}'
 
         return self
@@ -71,6 +129,7 @@ class Server():
         self = Server()
         self._server_proc = server_proc
         self._socket = create_and_connect(host, port)
+        self._selector = create_selector(self._socket)
         self._url = f'tcp://{host}:{port}'
 
         return self
@@ -91,9 +150,8 @@ class Server():
         Returns:
             A dictionary with branch and revision.
         """
-        version_request = pb.VersionRequest()
         user_message = pb.UserMessage()
-        user_message.versionRequest.CopyFrom(version_request)
+        user_message.versionRequest.SetInParent()
 
         self.push(user_message)
         p3dr_message = self.pop()
@@ -118,14 +176,13 @@ class Server():
         Returns:
             The new stream id.
         """
-        open_stream_request = pb.OpenStreamRequest()
+        user_message = pb.UserMessage()
+        open_stream_request = user_message.openStreamRequest
+        open_stream_request.SetInParent()
         for reference in references:
             reference.resolve()
             open_stream_request.reference_datasets.append(str(reference))
 
-        user_message = pb.UserMessage()
-        user_message.openStreamRequest.CopyFrom(open_stream_request)
-
         self.push(user_message)
         p3dr_message = self.pop()
 
@@ -144,12 +201,8 @@ class Server():
         Returns:
             The list of reference datasets.
         """
-        list_reference_request = pb.ListReferenceDatasetsRequest()
-        list_reference_request.stream_id = stream_id
-
         user_message = pb.UserMessage()
-        user_message.listReferenceDatasetsRequest.CopyFrom(
-            list_reference_request)
+        user_message.listReferenceDatasetsRequest.stream_id = stream_id
 
         self.push(user_message)
         p3dr_message = self.pop()
@@ -165,7 +218,8 @@ class Server():
             raise ValueError('Unexpected message type from video server')
 
     def request_registration(self: Server, stream_id: int, frame_id: int,
-                             camera: Dict[str, Any], image: Image.Image) -> bool:
+                             camera: Dict[str, Any], image: Image.Image,
+                             flush: bool = True) -> bool:
         """
         Request an asynchronous registration of the image and its metadata.
 
@@ -174,58 +228,26 @@ class Server():
             frame_id: The id for the current frame.
             camera: Dictionary with canonic camera metadata.
             image: Image in PIL format.
+            flush: Flag to tell if the request shall be sent directly. If
+                   False it is sent by the next flush.
 
         Returns:
             True if the request was possible to push to the server, False otherwise.
         """
         try:
-            latitude, longitude, height = camera['pos']
-            position = pb.Point()
-            position.latitude = latitude
-            position.longitude = longitude
-            position.height = height
-
-            yaw, pitch, roll = camera['att']
-            attitude = pb.Attitude()
-            attitude.yaw = math.degrees(yaw)
-            attitude.pitch = math.degrees(pitch)
-            attitude.roll = math.degrees(roll)
-
-            lens = camera['lens']
-            fov = pb.FieldOfView()
-            fov.horizontal = math.degrees(lens['hfov'])
-            fov.vertical = math.degrees(lens['vfov'])
-
-            lens_parameters = pb.LensParameters()
-            lens_parameters.k2 = lens.get('k2', 0.0)
-            lens_parameters.k3 = lens.get('k3', 0.0)
-            lens_parameters.k4 = lens.get('k4', 0.0)
-
-            metadata = pb.ImageMetadata()
-            metadata.position.CopyFrom(position)
-            metadata.attitude.CopyFrom(attitude)
-            metadata.fov.CopyFrom(fov)
-            metadata.lens_parameters.CopyFrom(lens_parameters)
+            request = self._req_msg.request
+            request.stream_id = stream_id
+            request.frame_id = frame_id
+
+            _pack_camera(request.frame.metadata, camera)
 
             image = image if image.mode == 'L' else image.convert('L')
-            grayscale_image = pb.GrayscaleImage()
+            grayscale_image = request.frame.grayscale_image
             grayscale_image.width = image.width
             grayscale_image.height = image.height
             grayscale_image.raw = image.tobytes()
 
-            frame = pb.Frame()
-            frame.metadata.CopyFrom(metadata)
-            frame.grayscale_image.CopyFrom(grayscale_image)
-
-            request = pb.RegistrationRequest()
-            request.stream_id = stream_id
-            request.frame_id = frame_id
-            request.frame.CopyFrom(frame)
-
-            user_message = pb.UserMessage()
-            user_message.request.CopyFrom(request)
-
-            self.push(user_message)
+            self.push(self._req_msg, flush=flush)
 
         except KeyError as e:
             print(f'Error: Missing key={e}')
@@ -265,17 +287,17 @@ class Server():
 
             attitude = metadata.attitude
             camera['att'] = [
-                math.radians(attitude.yaw),
-                math.radians(attitude.pitch),
-                math.radians(attitude.roll)
+                attitude.yaw * _RAD,
+                attitude.pitch * _RAD,
+                attitude.roll * _RAD
             ]
 
             fov = metadata.fov
             lens_parameters = metadata.lens_parameters
 
             lens = dict()
-            lens['hfov'] = math.radians(fov.horizontal)
-            lens['vfov'] = math.radians(fov.vertical)
+            lens['hfov'] = fov.horizontal * _RAD
+            lens['vfov'] = fov.vertical * _RAD
             if lens_parameters.k2 != 0.0:
                 lens['k2'] = lens_parameters.k2
             if lens_parameters.k3 != 0.0:
@@ -294,16 +316,31 @@ class Server():
                 f"Error: Unexpected message type='{p3dr_message.WhichOneof('message')}'")
             return None
 
-    def push(self: Server, message: pb.UserMessage) -> None:
+    def push(self: Server, message: pb.UserMessage, flush: bool = True) -> None:
         """
         Push a UserMessage to the server.
 
         Parameters:
             message: The UserMessage.
+            flush: Flag to tell if the message shall be sent directly. If
+                   False it is sent by the next flush, together with any
+                   other messages pushed in between.
+        """
+        assert self._socket is not None
+
+        self._tx_payloads.append(message.SerializeToString())
+        if flush:
+            self.flush()
+
+    def flush(self: Server) -> None:
+        """
+        Send all pushed messages that are not yet sent.
         """
         assert self._socket is not None
 
-        send_payload(self._socket, message.SerializeToString())
+        if len(self._tx_payloads) > 0:
+            send_payloads(self._socket, self._tx_payloads)
+            self._tx_payloads.clear()
 
     def pop(self: Server) -> pb.P3DRMessage | None:
         """
@@ -312,17 +349,17 @@ class Server():
         no message is sent from the server.
 
         Returns:
-            A P3DRMessage, or None.
+            A P3DRMessage, or None. The message object is reused, and is
+            only valid until the next pop.
         """
         assert self._socket is not None
 
         try:
-            payload = receive_payload(self._socket)
-
-            p3dr_message = pb.P3DRMessage()
-            p3dr_message.ParseFromString(payload)
+            with receive_payload(self._socket, self._rx_buf,
+                                 self._selector) as payload:
+                self._rx_msg.ParseFromString(payload)
 
-            return p3dr_message
+            return self._rx_msg
         except TimeoutError:
             print('Error: Timeout')
             return None
@@ -335,6 +372,8 @@ class Server():
         process is terminated.
         """
         if self._socket is not None:
+            self._selector.close()
+            self._selector = None
             self._socket.close()
             self._socket = None
 
@@ -363,9 +402,9 @@ class Server():
     @staticmethod
     def _start(server_path: pathlib.Path,
                severity: str,
-               max_attempts: int = 10) -> None | tuple[subprocess.Popen, str, int]:
+               timeout: float = 10.0) -> None | tuple[subprocess.Popen, str, int]:
 
-        address_file = address_file = tempfile.NamedTemporaryFile()
+        address_file = tempfile.NamedTemporaryFile()
 
         config_file = tempfile.NamedTemporaryFile()
         config_data = Server._config_data(severity=severity,
@@ -376,16 +415,20 @@ class Server():
         server_proc = subprocess.Popen(
             [server_path, 'run', '-c', config_file.name])
 
+        # Poll the address file frequently, as the server usually writes it
+        # within milliseconds. Give up if the server process exits.
+        deadline = time.monotonic() + timeout
         network_address = None
-        for _ in range(max_attempts):
-            try:
-                address_file.seek(0)
-                network_address = json.load(address_file)
-                break
-            except json.decoder.JSONDecodeError:
-                pass
-
-            time.sleep(1.0)
+        while time.monotonic() < deadline and server_proc.poll() is None:
+            if os.fstat(address_file.fileno()).st_size > 0:
+                try:
+                    address_file.seek(0)
+                    network_address = json.load(address_file)
+                    break
+                except json.decoder.JSONDecodeError:
+                    pass  # Not completely written yet.
+
+            time.sleep(_ADDRESS_POLL_INTERVAL)
 
         if network_address is None:
             Server._stop(server_proc)
@@ -1,9 +1,19 @@
 from __future__ import annotations  # noqa
 
-import select
+import selectors
 import socket
 import struct
 
+# Big endian 32-bit size tag, preceding each payload.
+_SIZE_TAG = struct.Struct('>I')
+
+# Flag to let the kernel wait for all requested data in a single receive
+# call, where supported.
+_RECV_FLAGS = getattr(socket, 'MSG_WAITALL', 0)
+
+# The max number of seconds to wait for data to arrive, or to be sent.
+_TIMEOUT = 30.0
+
 
 def create_and_connect(host: str, port: int) -> socket.socket:
     """
@@ -19,22 +29,56 @@ def create_and_connect(host: str, port: int) -> socket.socket:
     """
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.connect((host, port))
-    sock.setblocking(0)
+
+    # Give up rather than block forever if the peer stalls, also in the
+    # middle of a payload.
+    sock.settimeout(_TIMEOUT)
 
     return sock
 
 
-def receive_payload(sock: socket.socket) -> bytearray:
+def create_selector(sock: socket.socket) -> selectors.BaseSelector:
     """
-    Receive payload from the socket by reading size tagged data.
+    Create a selector waiting for the socket to become readable. The
+    selector is registered once, and can be reused for all receives
+    from the socket. The returned selector must be closed when done.
+
+    Parameters:
+        sock: The socket to wait for.
+
+    Returns:
+        The selector.
+    """
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+
+    return selector
+
+
+def receive_payload(sock: socket.socket, buffer: bytearray,
+                    selector: selectors.BaseSelector) -> memoryview:
+    """
+    Receive payload from the socket by reading size tagged data. Waits at
+    most 30 seconds for the payload to start arriving, and then at most
+    30 seconds for each further part of it, after which a ConnectionError
+    is raised.
 
     Parameters:
         sock: The socket to receive from.
+        buffer: Buffer to receive into, grown if the payload does not fit.
+        selector: Selector for the socket, created by create_selector.
 
     Returns:
-        Bytearray with the payload.
+        Memoryview of the payload in the buffer. Must be released before
+        the buffer is used again.
     """
-    return _read_bytes(sock, _read_size_tag(sock))
+    if not selector.select(_TIMEOUT):
+        raise TimeoutError('Socket select timeout')
+
+    with _read_bytes(sock, buffer, _SIZE_TAG.size) as size_tag:
+        size = _SIZE_TAG.unpack(size_tag)[0]
+
+    return _read_bytes(sock, buffer, size)
 
 
 def send_payload(sock: socket.socket, payload: bytearray) -> None:
@@ -45,24 +89,56 @@ def send_payload(sock: socket.socket, payload: bytearray) -> None:
         socket: The socket to use for sending.
         payload: The payload data.
     """
-    size_tag = struct.pack('>I', len(payload))
-    sock.sendall(size_tag + payload)
+    send_payloads(sock, [payload])
 
 
-def _read_bytes(sock: socket.socket, size: int) -> bytearray:
-    have_data = select.select([sock], [], [], 30.0)
-    if have_data[0]:
-        received = 0
-        payload = bytearray()
-        while received < size:
-            payload += sock.recv(size - received)
-            received = len(payload)
+def send_payloads(sock: socket.socket, payloads: list[bytearray]) -> None:
+    """
+    Write the payloads to the socket as size tagged data, in a single send
+    if possible.
 
-        return payload
+    Parameters:
+        socket: The socket to use for sending.
+        payloads: The payload data.
+    """
+    buffers = list()
+    for payload in payloads:
+        buffers.append(_SIZE_TAG.pack(len(payload)))
+        buffers.append(payload)
+
+    if hasattr(sock, 'sendmsg'):
+        # Send the size tags and the payloads together, without concatenating
+        # them, and then whatever remains if the send was partial.
+        sent = sock.sendmsg(buffers)
+        for buffer in buffers:
+            if sent >= len(buffer):
+                sent -= len(buffer)
+            else:
+                with memoryview(buffer) as view:
+                    sock.sendall(view[sent:])
+                sent = 0
     else:
-        raise TimeoutError('Socket select timeout')
-
-
-def _read_size_tag(sock: socket.socket) -> int:
-    size_tag = _read_bytes(sock, 4)
-    return struct.unpack('>I', size_tag)[0]
+        sock.sendall(b''.join(buffers))
+
+
+def _read_bytes(sock: socket.socket, buffer: bytearray, size: int) -> memoryview:
+    if len(buffer) < size:
+        buffer.extend(bytes(size - len(buffer)))
+
+    view = memoryview(buffer)[:size]
+    received = 0
+    while received < size:
+        try:
+            count = sock.recv_into(view[received:], size - received,
+                                   _RECV_FLAGS)
+        except TimeoutError:
+            # The stream cannot be resumed in the middle of a payload.
+            view.release()
+            raise ConnectionError('Socket receive timeout within a payload')
+
+        if count == 0:
+            view.release()
+            raise ConnectionError('Socket closed by peer')
+        received += count
+
+    return view
@@ -10,41 +10,48 @@ from numpy.typing import ArrayLike, NDArray
 from pyquaternion import Quaternion
 from typing import Any, Dict
 
+# Permutation from the camera body axes (forward, right, down) to the
+# axes of the lens frame (right, down, forward).
+_PERMUTE = geo.eulerd_zyx((-90., -90., 0.))
+
 
 class Camera:
     """
     Pinhole camera class, intended to work within the ECEF frame of
     reference. The camera can be directly created with a
-    quaternion, describing the global yaw (Z), pitch (Y) and roll (X)
-    attitudes, the ECEF position and a Lens object.
+    quaternion or a rotation matrix, describing the global yaw (Z),
+    pitch (Y) and roll (X) attitudes, the ECEF position and a Lens object.
 
     The camera can also be initialized through several helper
     functions.
     """
 
     def __init__(self: Camera,
-                 attitude: Quaternion,
+                 attitude: Quaternion | NDArray,
                  position: ArrayLike,
                  lens: Lens) -> None:
         """
         Create a Camera object.
 
         Parameters:
-            attitude: The global ECEF attitude expressed as a quaternion.
+            attitude: The global ECEF attitude expressed as a quaternion,
+                      or as a 3x3 rotation matrix.
             position: The ECEF position for the camera.
             lens: The Lens object for the camera.
             k2, k3, k4: Coefficients for radial distortion.
 
         """
-        self._poseQ = attitude
-        self._viewQ = attitude.conjugate
         self._position = np.array(position)
 
-        permute = Quaternion(axis=(0.0, 0.0, 1.0), degrees=-90) * \
-            Quaternion(axis=(0.0, 1.0, 0.0), degrees=-90)
-
-        self._lensQ = permute
-        self._nedQ = permute.conjugate
+        # The combined rotations from the ECEF frame to the camera frame,
+        # and from the camera frame to the ECEF frame.
+        if isinstance(attitude, Quaternion):
+            R = attitude.rotation_matrix
+        else:
+            R = np.asarray(attitude, dtype=np.float64)
+            assert R.shape == (3, 3)
+        self._R_fwd = _PERMUTE @ R.T
+        self._R_inv = R @ _PERMUTE.T
 
         self._lens = lens
 
@@ -98,7 +105,10 @@ class Camera:
         Returns:
             A Camera object.
         """
-        ecef = geo.ellipsoid_to_ecef(np.append(llh, ypr))
+        pose = np.empty(6, dtype=np.float64)
+        pose[:3] = llh
+        pose[3:] = ypr
+        ecef = geo.ellipsoid_to_ecef_fast(pose)
         return Camera.from_euler_ecef(xyz=ecef[:3], ypr=ecef[3:],
                                       fov=fov, k2=k2, k3=k3, k4=k4)
 
@@ -122,10 +132,61 @@ class Camera:
         Returns:
             A Camera object.
         """
-        ecef = geo.egm2008_to_ecef(np.append(llh, ypr))
+        pose = np.empty(6, dtype=np.float64)
+        pose[:3] = llh
+        pose[3:] = ypr
+        ecef = geo.egm2008_to_ecef(pose)
         return Camera.from_euler_ecef(xyz=ecef[:3], ypr=ecef[3:],
                                       fov=fov, k2=k2, k3=k3, k4=k4)
 
+    @staticmethod
+    def from_euler_ellipsoid_batch(llh: ArrayLike,
+                                   ypr: ArrayLike,
+                                   fov: tuple[float, float],
+                                   k2: float = 0.,
+                                   k3: float = 0.,
+                                   k4: float = 0.) -> list[Camera]:
+        """
+        Create a batch of Cameras, sharing the same lens, from latitudes,
+        longitudes, heights above the ellipsoid and geodetic attitudes.
+
+        Parameters:
+            llh: Array with shape (N, 3), with latitude, longitude and height.
+            ypr: Array with shape (N, 3), with yaw, pitch and roll (in degrees).
+            fov: Tuple with field of view (horizontal, vertical) in degrees.
+            k2, k3, k4: Coefficients for radial distortion.
+
+        Returns:
+            A list with N Camera objects.
+        """
+        ecef = geo.ellipsoid_to_ecef_batch(np.hstack((llh, ypr)))
+        return Camera._from_euler_ecef_batch(ecef=ecef, fov=fov,
+                                             k2=k2, k3=k3, k4=k4)
+
+    @staticmethod
+    def from_euler_egm2008_batch(llh: ArrayLike,
+                                 ypr: ArrayLike,
+                                 fov: tuple[float, float],
+                                 k2: float = 0.,
+                                 k3: float = 0.,
+                                 k4: float = 0.) -> list[Camera]:
+        """
+        Create a batch of Cameras, sharing the same lens, from latitudes,
+        longitudes, heights above the EGM2008 geoid and geodetic attitudes.
+
+        Parameters:
+            llh: Array with shape (N, 3), with latitude, longitude and height.
+            ypr: Array with shape (N, 3), with yaw, pitch and roll (in degrees).
+            fov: Tuple with field of view (horizontal, vertical) in degrees.
+            k2, k3, k4: Coefficients for radial distortion.
+
+        Returns:
+            A list with N Camera objects.
+        """
+        ecef = geo.egm2008_to_ecef_batch(np.hstack((llh, ypr)))
+        return Camera._from_euler_ecef_batch(ecef=ecef, fov=fov,
+                                             k2=k2, k3=k3, k4=k4)
+
     @staticmethod
     def from_euler_ecef(xyz: ArrayLike,
                         ypr: ArrayLike,
@@ -168,9 +229,20 @@ class Camera:
         Returns:
             A Camera object.
         """
-        attitude = Quaternion(matrix=R)
         lens = Lens(fov=fov, k2=k2, k3=k3, k4=k4)
-        return Camera(attitude=attitude, position=t, lens=lens)
+        return Camera(attitude=R, position=t, lens=lens)
+
+    @staticmethod
+    def _from_euler_ecef_batch(ecef: NDArray,
+                               fov: tuple[float, float],
+                               k2: float,
+                               k3: float,
+                               k4: float) -> list[Camera]:
+        lens = Lens(fov=fov, k2=k2, k3=k3, k4=k4)
+        Rs = geo.eulerd_zyx_batch(ecef[:, 3:])
+
+        return [Camera(attitude=R, position=t, lens=lens)
+                for R, t in zip(Rs, ecef[:, :3])]
 
     def ellipsoid_to_uv(self: Camera, llh: ArrayLike) -> NDArray:
         """
@@ -182,7 +254,7 @@ class Camera:
         Returns:
             Uv coordinate, where the "visible" area is in range 0, 0 to 1, 1.
         """
-        return self.xyz_to_uv(geo.ellipsoid_to_ecef(llh))
+        return self.xyz_to_uv(geo.ellipsoid_to_ecef_fast(llh))
 
     def egm2008_to_uv(self: Camera, llh: ArrayLike) -> NDArray:
         """
@@ -209,24 +281,66 @@ class Camera:
         uv, _ = self.xyz_to_uv_depth(xyz)
         return uv
 
+    def xyz_to_uv_batch(self: Camera, xyz: ArrayLike,
+                        dtype: np.dtype = np.float64) -> NDArray:
+        """
+        Project a batch of ECEF coordinates to uv coordinates on the image plane.
+
+        Parameters:
+            xyz: Array with N ECEF coordinates, with shape (N, 3).
+            dtype: The float type used for the lens projection (see
+                   Lens.xyz_to_uv_batch).
+
+        Returns:
+            Array with N uv coordinates, with shape (N, 2).
+        """
+        uv, _ = self.xyz_to_uv_depth_batch(xyz, dtype)
+        return uv
+
     def xyz_to_uv_depth(self: Camera, xyz: ArrayLike) -> tuple[NDArray, float]:
         """
         Project an ECEF coordinate to an uv coordinate on the image plane.
 
         Parameters:
-            xyz: ECEF coordinate.
+            xyz: ECEF coordinate, or an array with N ECEF coordinates with
+                 shape (N, 3) (see xyz_to_uv_depth_batch).
 
         Returns:
             Tuple with uv coordinate and the camera relative depth for the
             coordinate.
         """
-        xyz = np.array(xyz)
-        xyz -= self._position
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if xyz.ndim == 2:
+            return self.xyz_to_uv_depth_batch(xyz)
+
+        # The translation and rotation to the camera frame, with a single
+        # temporary.
+        cam = np.subtract(xyz, self._position)
+        cam = self._R_fwd @ cam
+
+        return self._lens.xyz_to_uv(cam), cam[2]
+
+    def xyz_to_uv_depth_batch(self: Camera,
+                              xyz: ArrayLike,
+                              dtype: np.dtype = np.float64) -> tuple[NDArray, NDArray]:
+        """
+        Project a batch of ECEF coordinates to uv coordinates on the image plane.
+
+        Parameters:
+            xyz: Array with N ECEF coordinates, with shape (N, 3).
+            dtype: The float type used for the lens projection (see
+                   Lens.xyz_to_uv_batch). The transformation to the camera
+                   frame is always made in double precision, since ECEF
+                   coordinates need it.
 
-        xyz = Quaternion.rotate(self._viewQ, xyz)
-        xyz = Quaternion.rotate(self._lensQ, xyz)
+        Returns:
+            Tuple with an array with N uv coordinates, with shape (N, 2), and
+            an array with the N camera relative depths.
+        """
+        cam = np.subtract(xyz, self._position, dtype=np.float64)
+        cam = cam @ self._R_fwd.T
 
-        return self._lens.xyz_to_uv(xyz), xyz[2]
+        return self._lens.xyz_to_uv_batch(cam, dtype), cam[:, 2]
 
     def uv_to_xyz(self: Camera, uv: ArrayLike, depth: float = 1.0) -> NDArray:
         """
@@ -241,10 +355,7 @@ class Camera:
             The reconstructed ECEF coordinate. The default depth of the coordinate
             is 1.0 (i.e. one meter from the camera along the principal axis).
         """
-        xyz = self._lens.uv_to_xyz(uv) * depth
-
-        xyz = Quaternion.rotate(self._nedQ, xyz)
-        xyz = Quaternion.rotate(self._poseQ, xyz)
+        xyz = self._R_inv @ (self._lens.uv_to_xyz(uv) * depth)
 
         return xyz + self._position
 
@@ -253,13 +364,20 @@ class Camera:
         Get a unit length ray for the uv.
 
         Parameters:
-            uv: Uv coordinate.
+            uv: Uv coordinate, or an array with N uv coordinates with
+                shape (N, 2).
 
-        Returns tuple with ray origin and ray direction.
+        Returns tuple with ray origin and ray direction. For N uv
+        coordinates the directions are given in an array with shape (N, 3).
         """
-        xyz = self.uv_to_xyz(uv)
-
-        dir = xyz - self._position
-        dir /= np.linalg.norm(dir)
+        # The direction is rotated directly from the camera frame, without
+        # going through an ECEF position.
+        xyz = self._lens.uv_to_xyz(uv)
+        if xyz.ndim == 2:
+            dir = xyz @ self._R_inv.T
+            dir /= np.linalg.norm(dir, axis=1, keepdims=True)
+        else:
+            dir = self._R_inv @ xyz
+            dir /= math.sqrt(dir @ dir)
 
         return self._position, dir
@@ -1,5 +1,6 @@
 from __future__ import annotations  # noqa
 
+import math
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
@@ -28,6 +29,10 @@ class Lens:
         self._k3 = k3
         self._k4 = k4
 
+        # Without distortion coefficients the distortion is the identity,
+        # and the scaling by it can be skipped.
+        self._has_distortion = bool(k2 or k3 or k4)
+
         # Focal length (default set to one).
         self._f = 1.0
 
@@ -42,26 +47,60 @@ class Lens:
         Project a camera frame xyz coordinate to the lens.
 
         Parameters:
-            xyz: The coordinate (z must be > zero).
+            xyz: The coordinate (z must be > zero), or an array with N
+                 coordinates with shape (N, 3) (see xyz_to_uv_batch).
 
         Returns:
             Uv coordinate, where the "visible" area is in range 0, 0 to 1, 1.
         """
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if xyz.ndim == 2:
+            return self.xyz_to_uv_batch(xyz)
+
         assert len(xyz) == 3
         assert xyz[2] > 0.
 
         # Normalize to a depth of 1.0.
-        xyz = np.array(xyz)
-        xyz /= xyz[2]
+        xy = xyz[:2] / xyz[2]
 
-        xy = xyz[:2]
-        z = xyz[2]
+        # Scale xy by radial distortion.
+        if self._has_distortion:
+            x, y = xy
+            xy *= self.radial_distortion(math.sqrt(x * x + y * y))
+
+        uv = self._f * xy
+        uv /= self._size
+
+        return uv + 0.5
+
+    def xyz_to_uv_batch(self: Lens, xyz: ArrayLike,
+                        dtype: np.dtype = np.float64) -> NDArray:
+        """
+        Project a batch of camera frame xyz coordinates to the lens.
+
+        Parameters:
+            xyz: Array with N coordinates, with shape (N, 3) (z must be > zero).
+            dtype: The float type used for the projection, and for the
+                   result. With np.float32 half the memory is used, and
+                   the uv precision is still about 1e-6 (well below a pixel
+                   at 4K), which is enough for large batches of coordinates.
+
+        Returns:
+            Array with N uv coordinates, with shape (N, 2).
+        """
+        xyz = np.asarray(xyz, dtype=dtype)
+        assert xyz.ndim == 2 and xyz.shape[1] == 3
+        assert np.all(xyz[:, 2] > 0.)
+
+        # Normalize to a depth of 1.0.
+        xy = xyz[:, :2] / xyz[:, 2:]
 
         # Scale xy by radial distortion.
-        s = self.radial_distortion(np.linalg.norm(xy))
-        xy *= s
+        if self._has_distortion:
+            s = self.radial_distortion(np.hypot(xy[:, 0], xy[:, 1]))
+            xy *= s[:, np.newaxis]
 
-        uv = self._f * xy / z
+        uv = self._f * xy
         uv /= self._size
 
         return uv + 0.5
@@ -72,58 +111,101 @@ class Lens:
         The reconstructed coordinate always has the depth of 1.
 
         Parameters:
-            uv: Uv coordinate.
+            uv: Uv coordinate, or an array with N uv coordinates with
+                shape (N, 2) (see uv_to_xyz_batch).
 
         Returns:
             Xyz coordinate in the camera frame.
         """
+        uv = np.asarray(uv, dtype=np.float64)
+        if uv.ndim == 2:
+            return self.uv_to_xyz_batch(uv)
+
         assert len(uv) == 2
 
-        uv = np.array(uv) - 0.5
-        uv *= self._size
-        xy = uv * self._inv_f
+        xyz = np.empty(3, dtype=np.float64)
+        xy = xyz[:2]
+        np.subtract(uv, 0.5, out=xy)
+        xy *= self._size * self._inv_f
 
         # Scale xy by inverse radial distortion.
-        s = self.inv_radial_distortion(np.linalg.norm(xy))
-        xy *= s
+        if self._has_distortion:
+            x, y = xy
+            xy *= self.inv_radial_distortion(math.sqrt(x * x + y * y))
+        xyz[2] = 1.
+
+        return xyz
+
+    def uv_to_xyz_batch(self: Lens, uv: ArrayLike) -> NDArray:
+        """
+        Reconstruct a batch of camera frame xyz coordinates from uv
+        coordinates. The reconstructed coordinates always have the depth of 1.
+
+        Parameters:
+            uv: Array with N uv coordinates, with shape (N, 2).
+
+        Returns:
+            Array with N xyz coordinates in the camera frame, with shape (N, 3).
+        """
+        uv = np.asarray(uv, dtype=np.float64)
+        assert uv.ndim == 2 and uv.shape[1] == 2
 
-        return np.append(xy, 1.)
+        xyz = np.empty((len(uv), 3), dtype=np.float64)
+        xy = xyz[:, :2]
+        np.subtract(uv, 0.5, out=xy)
+        xy *= self._size * self._inv_f
+
+        # Scale xy by inverse radial distortion, solved for all at once.
+        if self._has_distortion:
+            s = self.inv_radial_distortion(np.hypot(xy[:, 0], xy[:, 1]))
+            xy *= s[:, np.newaxis]
+        xyz[:, 2] = 1.
+
+        return xyz
 
     def radial_distortion(self: Lens, r: float) -> float:
-        r2 = r * r
-        r3 = r2 * r
-        r4 = r2 * r2
+        # 1 + k2 * r^2 + k3 * r^3 + k4 * r^4, in Horner form.
+        return 1. + r * r * (self._k2 + r * (self._k3 + r * self._k4))
+
+    def inv_radial_distortion(self: Lens, r: float | NDArray) -> float | NDArray:
+        if not self._has_distortion:
+            return np.ones_like(r) if isinstance(r, np.ndarray) else 1.
+
+        return _inv_radial_distortion(self._k2, self._k3, self._k4, r)
 
-        return 1. + self._k2 * r2 + self._k3 * r3 + self._k4 * r4
 
-    def inv_radial_distortion(self: Lens, r: float) -> float:
-        r2 = r * r
-        r3 = r * r2
-        r4 = r2 * r2
+def _inv_radial_distortion(k2: float, k3: float, k4: float,
+                           r: float | NDArray) -> float | NDArray:
+    """
+    Solve the inverse radial distortion with Newton's method. Only uses
+    arithmetic operations, so r can either be a scalar or a Numpy array,
+    which then is solved elementwise.
+    """
+    r2 = r * r
+    r3 = r * r2
+    r4 = r2 * r2
 
-        k2a = self._k2 * r2
-        k2b = k2a * 3.
+    k2a = k2 * r2
+    k2b = k2a * 3.
 
-        k3a = self._k3 * r3
-        k3b = k3a * 4.
+    k3a = k3 * r3
+    k3b = k3a * 4.
 
-        k4a = self._k4 * r4
-        k4b = k4a * 5.
+    k4a = k4 * r4
+    k4b = k4a * 5.
 
-        f0 = k2a + k3a + k4a
-        f1 = 1. + k2b + k3b + k4b
+    f0 = k2a + k3a + k4a
+    f1 = 1. + k2b + k3b + k4b
 
-        c = 1.
-        c -= f0 / f1
+    c = 1.
+    c -= f0 / f1
 
-        for _ in range(5):
-            c2 = c * c
-            c3 = c2 * c
-            c4 = c2 * c2
-            c5 = c2 * c3
+    for _ in range(5):
+        # The polynomials in c are evaluated in Horner form.
+        c2 = c * c
 
-            f0 = c + c3 * k2a + c4 * k3a + c5 * k4a - 1.
-            f1 = 1. + c2 * k2b + c3 * k3b + c4 * k4b
-            c -= f0 / f1
+        f0 = c + c2 * c * (k2a + c * (k3a + c * k4a)) - 1.
+        f1 = 1. + c2 * (k2b + c * (k3b + c * k4b))
+        c -= f0 / f1
 
-        return c
+    return c
@@ -14,7 +14,10 @@ def leastsq(func: Callable[[NDArray], NDArray],
             steps: float | ArrayLike = 1e-03,
             max_iter: int = 10,
             eps: float = 1e-03,
-            stop: float = 1e-03) -> Dict[str, Any]:
+            stop: float = 1e-03,
+            batched: bool = False,
+            central: bool = False,
+            jacobian: Callable[[NDArray], NDArray] | None = None) -> Dict[str, Any]:
     """
     Iteratively fit function parameters using Gauss-Newton's method.
 
@@ -34,6 +37,22 @@ def leastsq(func: Callable[[NDArray], NDArray],
         stop:   Inter iteration stop condition. If the change of the
                 error value between two iterations is lower than this
                 threshold the fitting is terminated.
+        batched: Flag to tell if the function is evaluating a batch of
+                parameter sets in one call. Then the function is taking
+                a 2-D Numpy array with one parameter set per row, and is
+                returning a 2-D Numpy array with the residuals for each
+                parameter set per row. The Jacobian is then computed with
+                one function call.
+        central: Flag to tell if the Jacobian shall be computed using
+                central differences. It takes twice the number of
+                function evaluations, but is more accurate (second order
+                in the steps), which allows larger steps and often gives
+                fewer iterations.
+        jacobian: Optional function computing the Jacobian of the residuals
+                analytically. It takes the parameters as a Numpy array, and
+                returns a 2-D Numpy array with one row per residual and one
+                column per parameter. If given, it is used instead of the
+                numerical differentiation, and steps is not used.
 
     Returns:
         A dictionary with the result from the fitting.
@@ -57,7 +76,8 @@ def leastsq(func: Callable[[NDArray], NDArray],
     assert params.shape == steps.shape
 
     # TODO: Add support for Levenberg-Marquard.
-    return _gauss_newton(func, params, steps, max_iter, eps, stop)
+    return _gauss_newton(func, params, steps, max_iter, eps, stop, batched,
+                         central, jacobian)
 
 
 def _gauss_newton(func: Callable[[NDArray], NDArray],
@@ -65,11 +85,17 @@ def _gauss_newton(func: Callable[[NDArray], NDArray],
                   steps: NDArray,
                   max_iter: int,
                   eps: float,
-                  stop: float) -> Dict[str, Any]:
+                  stop: float,
+                  batched: bool,
+                  central: bool,
+                  jacobian: Callable[[NDArray], NDArray] | None) -> Dict[str, Any]:
     latest_error: float = sys.float_info.max
     for iter in range(max_iter):
         # Compute the residuals, and their error, for the current set of parameters.
-        residuals = func(params)
+        if batched:
+            residuals = func(params[np.newaxis, :])[0]
+        else:
+            residuals = func(params)
         error: float = np.sum(residuals ** 2)
 
         # Check for success.
@@ -81,14 +107,23 @@ def _gauss_newton(func: Callable[[NDArray], NDArray],
             return _result(False, 'Too small change', iter, params, error)
 
         # Compute the Jacobian.
-        J = _Jacobian(func, params, steps)
+        if jacobian is not None:
+            J = jacobian(params)
+        else:
+            J = _Jacobian(func, params, steps, residuals, batched, central)
+
+        # Newton update, solved from the normal equations without
+        # inverting J^T J.
         JtJ = J.T @ J
+        if _det(JtJ) < 1e-08:
+            return _result(False, 'Singular matrix', iter, params, error)
 
-        if np.linalg.det(JtJ) < 1e-08:
+        try:
+            delta = np.linalg.solve(JtJ, J.T @ residuals)
+        except np.linalg.LinAlgError:
             return _result(False, 'Singular matrix', iter, params, error)
 
-        # Newton update.
-        params -= np.linalg.inv(JtJ) @ J.T @ residuals
+        params -= delta
 
         latest_error = error
 
@@ -98,24 +133,52 @@ def _gauss_newton(func: Callable[[NDArray], NDArray],
 
 def _Jacobian(func: Callable[[NDArray], NDArray],
               params: NDArray,
-              steps: NDArray) -> NDArray:
+              steps: NDArray,
+              r0: NDArray,
+              batched: bool,
+              central: bool) -> NDArray:
+    if batched and central:
+        # Evaluate all the parameter sets, each with one parameter
+        # stepped backward and forward, in a single call.
+        stepped = np.diag(steps)
+        r = func(params[np.newaxis, :] + np.vstack((-stepped, stepped)))
+        P = len(params)
+        return ((r[P:] - r[:P]) / (2. * steps[:, np.newaxis])).T
+    elif batched:
+        # Evaluate all the parameter sets, each with one parameter
+        # stepped, in a single call.
+        r1 = func(params[np.newaxis, :] + np.diag(steps))
+        return ((r1 - r0[np.newaxis, :]) / steps[:, np.newaxis]).T
+
     # Construct the Jacobian in its transpose.
-    r0 = func(params)
     J = np.zeros((len(params), len(r0)), dtype=np.float64)
 
     itr = np.nditer(params, flags=['f_index'])
     for _ in itr:
-        # TODO: Add central differentiation as alternative.
         step = steps[itr.index]
         params_step = params.copy()
         params_step[itr.index] += step
 
         r1 = func(params_step)
-        J[itr.index, :] = (r1 - r0) / step
+        if central:
+            params_step[itr.index] = params[itr.index] - step
+            J[itr.index, :] = (r1 - func(params_step)) / (2. * step)
+        else:
+            J[itr.index, :] = (r1 - r0) / step
 
     return J.T
 
 
+def _det(A: NDArray) -> float:
+    # The determinant of a 2x2 matrix, as for fits with two parameters, is
+    # computed directly, which is much cheaper than np.linalg.det.
+    if A.shape == (2, 2):
+        (a, b), (c, d) = A.tolist()
+        return a * d - b * c
+
+    return np.linalg.det(A)
+
+
 def _result(successful: bool, message: str, iterations: int, params: NDArray, error: float) -> Dict[str, Any]:
     return {
         'successful': successful,
@@ -0,0 +1,82 @@
+from __future__ import annotations  # noqa
+
+from maxar_tiny_fit import leastsq
+
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Callable
+import unittest
+
+# Samples of y = a * exp(b * t), with a = 2 and b = -0.5.
+_T = np.linspace(0., 4., 9)
+_Y = 2. * np.exp(-0.5 * _T)
+
+_SOLUTION = [2., -0.5]
+_INITIAL = [1., -0.1]
+
+
+def _residuals(params: NDArray) -> NDArray:
+    a, b = params
+    return a * np.exp(b * _T) - _Y
+
+
+def _residuals_batched(params: NDArray) -> NDArray:
+    a = params[:, 0, np.newaxis]
+    b = params[:, 1, np.newaxis]
+    return a * np.exp(b * _T) - _Y
+
+
+def _jacobian(params: NDArray) -> NDArray:
+    a, b = params
+    e = np.exp(b * _T)
+    return np.stack((e, a * _T * e), axis=1)
+
+
+class FitTest(unittest.TestCase):
+    """
+    Testing that the modes of leastsq converge to the same solution.
+    """
+
+    def fit(self: FitTest, func: Callable[[NDArray], NDArray],
+            **kwargs: Any) -> NDArray:
+        result = leastsq(func, _INITIAL, eps=1e-20, stop=1e-24, max_iter=50,
+                         **kwargs)
+        self.assertTrue(result['successful'], result['message'])
+
+        return result['params']
+
+    def test_default(self: FitTest) -> None:
+        params = self.fit(_residuals)
+        np.testing.assert_allclose(params, _SOLUTION, rtol=1e-6)
+
+    def test_batched(self: FitTest) -> None:
+        params = self.fit(_residuals_batched, batched=True)
+        np.testing.assert_allclose(params, self.fit(_residuals), rtol=1e-9)
+
+    def test_central(self: FitTest) -> None:
+        params = self.fit(_residuals, central=True)
+        np.testing.assert_allclose(params, self.fit(_residuals), rtol=1e-9)
+
+    def test_batched_central(self: FitTest) -> None:
+        params = self.fit(_residuals_batched, batched=True, central=True)
+        np.testing.assert_allclose(params, self.fit(_residuals), rtol=1e-9)
+
+    def test_jacobian(self: FitTest) -> None:
+        params = self.fit(_residuals, jacobian=_jacobian)
+        np.testing.assert_allclose(params, self.fit(_residuals), rtol=1e-9)
+
+    def test_jacobian_ignores_steps(self: FitTest) -> None:
+        # Zero steps cannot be used for numerical differentiation, and must
+        # not be when the Jacobian is given. Then the function is only
+        # evaluated once per iteration.
+        calls = list()
+
+        def func(params: NDArray) -> NDArray:
+            calls.append(params.copy())
+            return _residuals(params)
+
+        result = leastsq(func, _INITIAL, steps=0.0, eps=1e-20, stop=1e-24,
+                         max_iter=50, jacobian=_jacobian)
+        self.assertTrue(result['successful'], result['message'])
+        np.testing.assert_allclose(result['params'], _SOLUTION, rtol=1e-6)
+        self.assertEqual(result['iterations'] + 1, len(calls))
@@ -2,7 +2,11 @@
 The maxar_tiny_geo package provides basic coordinate transformations.
 """
 from .nav import local_ned_axes, euler_zyx, decomp_euler_zyx, eulerd_zyx, decomp_eulerd_zyx  # noqa
+from .nav import local_ned_axes_batch, euler_zyx_batch, decomp_euler_zyx_batch, eulerd_zyx_batch, decomp_eulerd_zyx_batch  # noqa
+from .pose_array import PoseArray  # noqa
 from .transform import setup, egm2008_to_ecef, ecef_to_egm2008, ellipsoid_to_ecef, ecef_to_ellipsoid  # noqa
+from .transform import ellipsoid_to_ecef_fast  # noqa
+from .transform import egm2008_to_ecef_batch, ecef_to_egm2008_batch, ellipsoid_to_ecef_batch, ecef_to_ellipsoid_batch  # noqa
 
 if not setup():
     raise RuntimeError('Failed to setup maxar_tiny_geo')
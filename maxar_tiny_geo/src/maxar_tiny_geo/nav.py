@@ -126,3 +126,125 @@ def decomp_eulerd_zyx(mat: NDArray) -> NDArray:
         Array with Euler angles yaw, pitch and roll in degrees.
     """
     return np.degrees(decomp_euler_zyx(mat))
+
+
+def local_ned_axes_batch(llh: ArrayLike) -> NDArray:
+    """
+    Create local NED frames for a batch of geodetic locations.
+
+    Parameters:
+        llh: Array with shape (N, 3), with latitude (degrees),
+             longitude (degrees), height.
+
+    Returns:
+        Array with shape (N, 3, 3), with the rotation matrices.
+    """
+    llh = np.asarray(llh, dtype=np.float64)
+    assert llh.ndim == 2 and llh.shape[1] == 3
+
+    lat = np.radians(llh[:, 0])
+    lon = np.radians(llh[:, 1])
+
+    slat = np.sin(lat)
+    clat = np.cos(lat)
+    slon = np.sin(lon)
+    clon = np.cos(lon)
+
+    mat = np.empty((len(llh), 3, 3), dtype=np.float64)
+    mat[:, 0, 0] = -slat * clon
+    mat[:, 0, 1] = -slon
+    mat[:, 0, 2] = -clat * clon
+
+    mat[:, 1, 0] = -slat * slon
+    mat[:, 1, 1] = clon
+    mat[:, 1, 2] = -clat * slon
+
+    mat[:, 2, 0] = clat
+    mat[:, 2, 1] = 0.
+    mat[:, 2, 2] = -slat
+
+    return mat
+
+
+def euler_zyx_batch(ypr: ArrayLike) -> NDArray:
+    """
+    Create Euler rotation matrices for the axis order z, y, x, for a batch
+    of angles.
+
+    Parameters:
+        ypr: Array with shape (N, 3), with yaw, pitch and roll in radians.
+
+    Returns:
+        Array with shape (N, 3, 3), with the rotation matrices.
+    """
+    ypr = np.asarray(ypr, dtype=np.float64)
+    assert ypr.ndim == 2 and ypr.shape[1] == 3
+
+    cz, cy, cx = np.cos(ypr).T
+    sz, sy, sx = np.sin(ypr).T
+
+    mat = np.empty((len(ypr), 3, 3), dtype=np.float64)
+    mat[:, 0, 0] = cy * cz
+    mat[:, 0, 1] = cz * sx * sy - cx * sz
+    mat[:, 0, 2] = cx * cz * sy + sx * sz
+
+    mat[:, 1, 0] = cy * sz
+    mat[:, 1, 1] = cx * cz + sx * sy * sz
+    mat[:, 1, 2] = -cz * sx + cx * sy * sz
+
+    mat[:, 2, 0] = -sy
+    mat[:, 2, 1] = cy * sx
+    mat[:, 2, 2] = cx * cy
+
+    return mat
+
+
+def eulerd_zyx_batch(ypr: ArrayLike) -> NDArray:
+    """
+    Create Euler rotation matrices for the axis order z, y, x, for a batch
+    of angles.
+
+    Parameters:
+        ypr: Array with shape (N, 3), with yaw, pitch and roll in degrees.
+
+    Returns:
+        Array with shape (N, 3, 3), with the rotation matrices.
+    """
+    return euler_zyx_batch(np.radians(ypr))
+
+
+def decomp_euler_zyx_batch(mat: NDArray) -> NDArray:
+    """
+    Decompose a batch of rotation matrices into Euler angles, given the
+    axis order z, y, x.
+
+    Parameters:
+        mat: Array with shape (N, 3, 3), with the rotation matrices.
+
+    Returns:
+        Array with shape (N, 3), with Euler angles yaw, pitch and roll
+        in radians.
+    """
+    assert mat.ndim == 3 and mat.shape[1:] == (3, 3)
+
+    ypr = np.empty((len(mat), 3), dtype=np.float64)
+    ypr[:, 0] = np.arctan2(mat[:, 1, 0], mat[:, 0, 0])
+    ypr[:, 1] = np.arcsin(-mat[:, 2, 0])
+    ypr[:, 2] = np.arctan2(mat[:, 2, 1], mat[:, 2, 2])
+
+    return ypr
+
+
+def decomp_eulerd_zyx_batch(mat: NDArray) -> NDArray:
+    """
+    Decompose a batch of rotation matrices into Euler angles, given the
+    axis order z, y, x.
+
+    Parameters:
+        mat: Array with shape (N, 3, 3), with the rotation matrices.
+
+    Returns:
+        Array with shape (N, 3), with Euler angles yaw, pitch and roll
+        in degrees.
+    """
+    return np.degrees(decomp_euler_zyx_batch(mat))
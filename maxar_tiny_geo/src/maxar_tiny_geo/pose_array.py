@@ -0,0 +1,63 @@
+"""
+Module with the PoseArray class, storing a batch of locations or poses
+as a struct of arrays.
+"""
+from __future__ import annotations  # noqa
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+class PoseArray:
+    """
+    A batch of N locations or poses, stored with one contiguous array per
+    term instead of one array per pose. The terms are latitude, longitude,
+    height for geodetic locations or x, y, z for ECEF locations, followed
+    by yaw, pitch, roll for poses.
+    """
+
+    def __init__(self: PoseArray, terms: ArrayLike) -> None:
+        """
+        Create a PoseArray object.
+
+        Parameters:
+            terms: Array with shape (3, N) or (6, N), with one row per term.
+        """
+        self._terms = np.ascontiguousarray(terms, dtype=np.float64)
+        if self._terms.ndim != 2 or \
+                (self._terms.shape[0] != 3 and self._terms.shape[0] != 6):
+            raise ValueError('Pose array must have either three or six terms')
+
+    @staticmethod
+    def from_aos(poses: ArrayLike) -> PoseArray:
+        """
+        Create a PoseArray object from an array with one pose per row.
+
+        Parameters:
+            poses: Array with shape (N, 3) or (N, 6).
+
+        Returns:
+            A PoseArray object.
+        """
+        return PoseArray(np.asarray(poses, dtype=np.float64).T)
+
+    def to_aos(self: PoseArray) -> NDArray:
+        """
+        Get the poses as an array with one pose per row.
+
+        Returns:
+            Array with shape (N, 3) or (N, 6).
+        """
+        return np.ascontiguousarray(self._terms.T)
+
+    def terms(self: PoseArray) -> NDArray:
+        """
+        Get the terms, with one contiguous row per term.
+
+        Returns:
+            Array with shape (3, N) or (6, N).
+        """
+        return self._terms
+
+    def __len__(self: PoseArray) -> int:
+        return self._terms.shape[1]
@@ -14,11 +14,19 @@ negative heights for EGM2008 and ELLIPSOID coordinates.
 from __future__ import annotations  # noqa
 
 from .nav import local_ned_axes, eulerd_zyx, decomp_eulerd_zyx
+from .nav import local_ned_axes_batch, eulerd_zyx_batch, decomp_eulerd_zyx_batch
+from .pose_array import PoseArray
 
+import math
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 import pathlib
 import pyproj
+from typing import Callable
+
+# The WGS84 semi-major axis and squared first eccentricity.
+__WGS84_A = 6378137.0
+__WGS84_E2 = 6.69437999014e-3
 
 __egm2008_to_ecef = None
 __ecef_to_egm2008 = None
@@ -56,11 +64,18 @@ def setup() -> bool:
         ellipsoid = pyproj.CRS.from_proj4(ellipsoid_str)
         ecef = pyproj.CRS.from_proj4(ecef_str)
 
-        __egm2008_to_ecef = pyproj.Transformer.from_crs(egm2008, ecef)
-        __ecef_to_egm2008 = pyproj.Transformer.from_crs(ecef, egm2008)
+        # The transformers always take and give longitude before latitude,
+        # regardless of the axis order of the CRS definitions. They are
+        # created once, and reused for all transformations.
+        __egm2008_to_ecef = pyproj.Transformer.from_crs(
+            egm2008, ecef, always_xy=True)
+        __ecef_to_egm2008 = pyproj.Transformer.from_crs(
+            ecef, egm2008, always_xy=True)
 
-        __ellipsoid_to_ecef = pyproj.Transformer.from_crs(ellipsoid, ecef)
-        __ecef_to_ellipsoid = pyproj.Transformer.from_crs(ecef, ellipsoid)
+        __ellipsoid_to_ecef = pyproj.Transformer.from_crs(
+            ellipsoid, ecef, always_xy=True)
+        __ecef_to_ellipsoid = pyproj.Transformer.from_crs(
+            ecef, ellipsoid, always_xy=True)
 
         return True
     else:
@@ -83,7 +98,7 @@ def egm2008_to_ecef(pose: ArrayLike) -> NDArray:
         Array with x, y, z or, array with x, y, z, yaw, pitch, roll
     """
     assert __egm2008_to_ecef is not None
-    return __to_ecef(pose, __egm2008_to_ecef)
+    return __to_ecef(pose, __egm2008_to_ecef.transform)
 
 
 def ellipsoid_to_ecef(pose: ArrayLike) -> NDArray:
@@ -101,7 +116,26 @@ def ellipsoid_to_ecef(pose: ArrayLike) -> NDArray:
         Array with x, y, z or, array with x, y, z, yaw, pitch, roll
     """
     assert __ellipsoid_to_ecef is not None
-    return __to_ecef(pose, __ellipsoid_to_ecef)
+    return __to_ecef(pose, __ellipsoid_to_ecef.transform)
+
+
+def ellipsoid_to_ecef_fast(pose: ArrayLike) -> NDArray:
+    """
+    Transform from a geodetic ELLIPSOID location or pose to a
+    geocentric ECEF location or pose. The same as ellipsoid_to_ecef, but
+    the location is computed with the closed form WGS84 formula instead of
+    a transformer call, which is much cheaper for single locations.
+
+    All angles are supposed to be in degrees.
+
+    Parameters:
+        pose: Array with latitude, longitude, height or
+              array with latitude, longitude, height, yaw, pitch, roll
+
+    Returns:
+        Array with x, y, z or, array with x, y, z, yaw, pitch, roll
+    """
+    return __to_ecef(pose, __wgs84_to_ecef)
 
 
 def ecef_to_egm2008(pose: ArrayLike) -> NDArray:
@@ -142,19 +176,118 @@ def ecef_to_ellipsoid(pose: ArrayLike) -> NDArray:
     return __from_ecef(pose, __ecef_to_ellipsoid)
 
 
-def __to_ecef(pose: ArrayLike, T: pyproj.Transformer) -> NDArray:
+def egm2008_to_ecef_batch(poses: ArrayLike | PoseArray) -> NDArray | PoseArray:
+    """
+    Transform a batch of geodetic EGM2008 locations or poses to geocentric
+    ECEF locations or poses, with a single transformer call.
+
+    All angles are supposed to be in degrees.
+
+    Parameters:
+        poses: Array with shape (N, 3), with latitude, longitude, height, or
+               array with shape (N, 6), with latitude, longitude, height,
+               yaw, pitch, roll. Or a PoseArray with the same terms.
+
+    Returns:
+        Array with shape (N, 3), with x, y, z or array with shape (N, 6),
+        with x, y, z, yaw, pitch, roll. A PoseArray if given a PoseArray.
+    """
+    assert __egm2008_to_ecef is not None
+    return __to_ecef_batch(poses, __egm2008_to_ecef)
+
+
+def ellipsoid_to_ecef_batch(poses: ArrayLike | PoseArray) -> NDArray | PoseArray:
+    """
+    Transform a batch of geodetic ELLIPSOID locations or poses to geocentric
+    ECEF locations or poses, with a single transformer call.
+
+    All angles are supposed to be in degrees.
+
+    Parameters:
+        poses: Array with shape (N, 3), with latitude, longitude, height, or
+               array with shape (N, 6), with latitude, longitude, height,
+               yaw, pitch, roll. Or a PoseArray with the same terms.
+
+    Returns:
+        Array with shape (N, 3), with x, y, z or array with shape (N, 6),
+        with x, y, z, yaw, pitch, roll. A PoseArray if given a PoseArray.
+    """
+    assert __ellipsoid_to_ecef is not None
+    return __to_ecef_batch(poses, __ellipsoid_to_ecef)
+
+
+def ecef_to_egm2008_batch(poses: ArrayLike | PoseArray) -> NDArray | PoseArray:
+    """
+    Transform a batch of geocentric ECEF locations or poses to geodetic
+    EGM2008 locations or poses, with a single transformer call.
+
+    All angles are supposed to be in degrees.
+
+    Parameters:
+        poses: Array with shape (N, 3), with x, y, z or array with
+               shape (N, 6), with x, y, z, yaw, pitch, roll. Or a
+               PoseArray with the same terms.
+
+    Returns:
+        Array with shape (N, 3), with latitude, longitude, height, or
+        array with shape (N, 6), with latitude, longitude, height,
+        yaw, pitch, roll. A PoseArray if given a PoseArray.
+    """
+    assert __ecef_to_egm2008 is not None
+    return __from_ecef_batch(poses, __ecef_to_egm2008)
+
+
+def ecef_to_ellipsoid_batch(poses: ArrayLike | PoseArray) -> NDArray | PoseArray:
+    """
+    Transform a batch of geocentric ECEF locations or poses to geodetic
+    ELLIPSOID locations or poses, with a single transformer call.
+
+    All angles are supposed to be in degrees.
+
+    Parameters:
+        poses: Array with shape (N, 3), with x, y, z or array with
+               shape (N, 6), with x, y, z, yaw, pitch, roll. Or a
+               PoseArray with the same terms.
+
+    Returns:
+        Array with shape (N, 3), with latitude, longitude, height, or
+        array with shape (N, 6), with latitude, longitude, height,
+        yaw, pitch, roll. A PoseArray if given a PoseArray.
+    """
+    assert __ecef_to_ellipsoid is not None
+    return __from_ecef_batch(poses, __ecef_to_ellipsoid)
+
+
+def __wgs84_to_ecef(lon: float, lat: float, h: float) -> tuple[float, float, float]:
+    lon = math.radians(lon)
+    lat = math.radians(lat)
+
+    sin_lat = math.sin(lat)
+    cos_lat = math.cos(lat)
+
+    # The prime vertical radius of curvature.
+    N = __WGS84_A / math.sqrt(1.0 - __WGS84_E2 * sin_lat * sin_lat)
+
+    return ((N + h) * cos_lat * math.cos(lon),
+            (N + h) * cos_lat * math.sin(lon),
+            (N * (1.0 - __WGS84_E2) + h) * sin_lat)
+
+
+def __to_ecef(pose: ArrayLike, transform: Callable) -> NDArray:
     if len(pose) == 3:
         lat, lon, h = pose
-        return np.array(T.transform(lon, lat, h))
+        return np.array(transform(lon, lat, h))
     elif len(pose) == 6:
         llh = pose[:3]
         ypr = pose[3:]
 
         mat = local_ned_axes(llh) @ eulerd_zyx(ypr)
-        eulerd = decomp_eulerd_zyx(mat)
 
         lat, lon, h = llh
-        return np.append(T.transform(lon, lat, h), eulerd)
+        out = np.empty(6, dtype=np.float64)
+        out[:3] = transform(lon, lat, h)
+        out[3:] = decomp_eulerd_zyx(mat)
+        return out
     else:
         raise ValueError('Pose array must have either three or six elements')
 
@@ -172,8 +305,61 @@ def __from_ecef(pose: ArrayLike, T: pyproj.Transformer) -> NDArray:
         llh = lat, lon, h
 
         mat = local_ned_axes(llh).T @ eulerd_zyx(ypr)
-        eulerd = decomp_eulerd_zyx(mat)
 
-        return np.append(llh, eulerd)
+        out = np.empty(6, dtype=np.float64)
+        out[:3] = llh
+        out[3:] = decomp_eulerd_zyx(mat)
+        return out
     else:
         raise ValueError('Pose array must have either three or six elements')
+
+
+def __to_ecef_batch(poses: ArrayLike | PoseArray,
+                    T: pyproj.Transformer) -> NDArray | PoseArray:
+    if isinstance(poses, PoseArray):
+        return PoseArray(__to_ecef_terms(poses.terms(), T))
+    else:
+        return __to_ecef_terms(__batch_array(poses).T, T).T
+
+
+def __from_ecef_batch(poses: ArrayLike | PoseArray,
+                      T: pyproj.Transformer) -> NDArray | PoseArray:
+    if isinstance(poses, PoseArray):
+        return PoseArray(__from_ecef_terms(poses.terms(), T))
+    else:
+        return __from_ecef_terms(__batch_array(poses).T, T).T
+
+
+def __to_ecef_terms(terms: NDArray, T: pyproj.Transformer) -> NDArray:
+    out = np.empty_like(terms)
+
+    lat, lon, h = terms[:3]
+    out[0], out[1], out[2] = T.transform(lon, lat, h)
+
+    if len(terms) == 6:
+        mat = local_ned_axes_batch(terms[:3].T) @ eulerd_zyx_batch(terms[3:].T)
+        out[3:] = decomp_eulerd_zyx_batch(mat).T
+
+    return out
+
+
+def __from_ecef_terms(terms: NDArray, T: pyproj.Transformer) -> NDArray:
+    out = np.empty_like(terms)
+
+    x, y, z = terms[:3]
+    out[1], out[0], out[2] = T.transform(x, y, z)
+
+    if len(terms) == 6:
+        ned = local_ned_axes_batch(out[:3].T)
+        mat = ned.transpose(0, 2, 1) @ eulerd_zyx_batch(terms[3:].T)
+        out[3:] = decomp_eulerd_zyx_batch(mat).T
+
+    return out
+
+
+def __batch_array(poses: ArrayLike) -> NDArray:
+    poses = np.asarray(poses, dtype=np.float64)
+    if poses.ndim != 2 or (poses.shape[1] != 3 and poses.shape[1] != 6):
+        raise ValueError('Pose array must have either three or six columns')
+
+    return poses
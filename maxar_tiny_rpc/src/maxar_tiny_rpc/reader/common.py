@@ -1,87 +1,150 @@
 """
-Common parser combinators etc.
+Common scanning functions etc.
+
+The RPC file formats are regular, and are scanned directly with string
+operations and regular expressions rather than with a parser combinator
+library.
 """
 from __future__ import annotations  # noqa
 
-from parsy import Parser, regex, string
+import numpy as np
+from numpy.typing import NDArray
+import re
 from typing import Any, Dict
 
+# Pattern for a number.
+_NUMBER = r'[-\+]?(?:0|[1-9][0-9]*)(?:[.][0-9]+)?(?:[eE][+-]?[0-9]+)?'
+_NUMBER_RE = re.compile(_NUMBER)
 
-def lexeme(parser: Parser) -> Parser:
-    """
-    Combine the given parser with a postlude whitespace consumer.
-    """
-    return parser << whitespace()
+# Pattern for a key.
+_KEY = r'[A-Za-z][A-Za-z0-9_]*'
+_KEY_RE = re.compile(_KEY)
 
 
-def whitespace() -> Parser:
+class ParseError(ValueError):
     """
-    Parser that is consuming whitespace.
+    Error raised when the content is not following the file format.
     """
-    return regex(r'\s*')
 
+    def __init__(self: ParseError, expected: str, content: str, index: int) -> None:
+        """
+        Create a ParseError.
 
-def comma() -> Parser:
-    """
-    Parser that is accepting a comma.
-    """
-    return lexeme(string(','))
+        Parameters:
+            expected: Description of what was expected.
+            content: The content being scanned.
+            index: The index in the content where the error is found.
+        """
+        line = content.count('\n', 0, index)
+        column = index - (content.rfind('\n', 0, index) + 1)
+        super().__init__(f'expected {expected} at {line}:{column}')
 
 
-def colon() -> Parser:
+def skip_whitespace(content: str, index: int) -> int:
     """
-    Parser that is accepting a colon.
+    Skip whitespace in the content, starting at the index.
+
+    Returns:
+        The index of the first non whitespace character, or the length
+        of the content.
     """
-    return lexeme(string(':'))
+    while index < len(content) and content[index].isspace():
+        index += 1
 
+    return index
 
-def lparen() -> Parser:
+
+def key(content: str, start: int, end: int) -> str:
     """
-    Parser that is accepting a left parenthesis.
+    Scan a key, surrounded by optional whitespace, in content[start:end].
     """
-    return lexeme(string('('))
+    text = content[start:end].strip()
+    if _KEY_RE.fullmatch(text) is None:
+        raise ParseError('a key', content, start)
+
+    return text
 
 
-def rparen() -> Parser:
+def number(content: str, start: int, end: int,
+           number_re: re.Pattern = _NUMBER_RE) -> float:
     """
-    Parser that is accepting a right parenthesis.
+    Scan a number, surrounded by optional whitespace, in content[start:end],
+    and convert it to float.
     """
-    return lexeme(string(')'))
+    text = content[start:end].strip()
+    if number_re.fullmatch(text) is None:
+        raise ParseError('a number', content, start)
+
+    return float(text)
 
 
-def semicolon() -> Parser:
+def number_list(content: str, start: int, end: int) -> NDArray:
     """
-    Parser that is accepting a semicolon.
+    Scan a sequence of numbers in content[start:end], separated by
+    whitespace and optional commas, and convert to a Numpy array.
     """
-    return lexeme(string(';'))
+    text = content[start:end]
+    if len(text.strip()) == 0:
+        return np.empty(0, dtype=np.float64)
 
+    parts = text.split(',')
+    if len(parts) > 1 and len(parts[-1].strip()) == 0:
+        parts.pop()  # A trailing comma.
 
-def equals() -> Parser:
-    """
-    Parser that is accepting an equals sign.
-    """
-    return lexeme(string('='))
+    tokens = list()
+    for part in parts:
+        part_tokens = part.split()
+        if len(part_tokens) == 0:
+            raise ParseError('a number', content, start)
 
+        for token in part_tokens:
+            if _NUMBER_RE.fullmatch(token) is None:
+                raise ParseError('a number', content, start)
 
-def quote() -> Parser:
-    """
-    Parser that is accepting a double quote.
-    """
-    return lexeme(string('\"'))
+        tokens.extend(part_tokens)
+
+    # Let Numpy convert all the validated numbers at once.
+    return np.array(tokens, dtype=np.float64)
 
 
-def key() -> Parser:
+def key_number_re(number: str = _NUMBER, units: tuple[str, ...] = ()) -> re.Pattern:
     """
-    Parser consuming a key pattern.
+    Compile a pattern for a 'KEY: number' assignment on a line of its own,
+    where the number optionally is followed by one of the given units.
+    The key and the number are the groups of the pattern.
     """
-    return lexeme(regex(r'[A-Za-z][A-Za-z0-9_]*'))
+    unit = rf'(?:[ \t]*(?:{"|".join(units)}))?' if len(units) > 0 else ''
+    return re.compile(rf'\s*({_KEY})[ \t]*:[ \t]*({number}){unit}[ \t]*(?=\r?\n|\Z)')
+
+
+_KEY_NUMBER_RE = key_number_re()
 
 
-def number() -> Parser:
+def key_number_lines(content: str,
+                     assignment_re: re.Pattern = _KEY_NUMBER_RE) -> list[tuple[str, float]]:
     """
-    Parser consuming a number pattern, and converting to float.
+    Scan content with one 'KEY: number' assignment per line, using a
+    pattern from key_number_re. The whole content is scanned with one
+    finditer, where the assignments must follow each other directly.
+
+    Returns:
+        A list of key and value tuples.
     """
-    return lexeme(regex(r'[-\+]?(0|[1-9][0-9]*)([.][0-9]+)?([eE][+-]?[0-9]+)?')).map(float)
+    data = list()
+
+    index = 0
+    for match in assignment_re.finditer(content):
+        if match.start() != index:
+            break
+
+        data.append((match[1], float(match[2])))
+        index = match.end()
+
+    index = skip_whitespace(content, index)
+    if index < len(content):
+        raise ParseError("a 'KEY: number' assignment", content, index)
+
+    return data
 
 
 def remap(data: list) -> Dict[str, Any]:
@@ -93,13 +156,13 @@ def remap(data: list) -> Dict[str, Any]:
     for key, value in data:
         rpc[key] = value
 
-    # Reduce the coefficients to lists.
+    # Reduce the coefficients to arrays.
     for coeff in ['LINE_NUM_COEFF', 'LINE_DEN_COEFF',
                   'SAMP_NUM_COEFF',  'SAMP_DEN_COEFF']:
-        values = list()
+        values = np.empty(20, dtype=np.float64)
         for index in range(1, 21):
             key = f'{coeff}_{index}'
-            values.append(rpc.pop(key))
+            values[index - 1] = rpc.pop(key)
 
         rpc[coeff] = values
 
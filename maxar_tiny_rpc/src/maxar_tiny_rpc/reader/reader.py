@@ -1,20 +1,25 @@
 from __future__ import annotations  # noqa
 
+from maxar_tiny_rpc.reader.common import ParseError
 import maxar_tiny_rpc.reader.rpb as rpb
 import maxar_tiny_rpc.reader.rpc as rpc
 import maxar_tiny_rpc.reader.rpc_txt as rpc_txt
 
+from functools import lru_cache
 import numpy as np
 from numpy.typing import NDArray
-from parsy import ParseError
 import pathlib
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 
 def read_file(path: pathlib.Path) -> Dict[str, NDArray] | None:
     """
     Read a RPC file (.rpc, .RPB or _rpc.txt) from the given path.
 
+    The results are cached by the resolved path and the modification time
+    of the file, so reading an unchanged file again does not parse it
+    again. The arrays are shared between the reads, and are read-only.
+
     Parameters:
         path: Path to RPC file.
 
@@ -26,50 +31,88 @@ def read_file(path: pathlib.Path) -> Dict[str, NDArray] | None:
         print(f"Error: '{path}' is not a valid RPC file")
         return None
 
+    # Check the suffix before reading, so that files with an unknown
+    # suffix are never read. The suffix is taken from the given path,
+    # which may be a link to a file with another name.
+    parse = parser(path)
+    if parse is None:
+        print(f"Error: '{path}' does not have a valid RPC file suffix")
+        return None
+
     try:
-        with open(path, 'r') as f:
-            content = f.read()
-
-            if path.suffix == '.RPB':
-                return normalize(rpb.parse(content))
-            elif path.suffix == '.rpc':
-                return normalize(rpc.parse(content))
-            elif path.name.endswith('_rpc.txt'):
-                return normalize(rpc_txt.parse(content))
-            else:
-                print(f"Error: '{path}' does not have a valid RPC file suffix")
-                return None
+        return dict(_read_file_cached(str(path.resolve()), path.stat().st_mtime_ns,
+                                      parse))
     except KeyError as e:
         print(f"Error: '{path} missing key {e}")
         return None
     except ParseError as e:
         print(f"Error: '{path} {e}")
         return None
+    except ValueError as e:
+        print(f"Error: '{path} invalid value {e}")
+        return None
+
+
+def parser(path: pathlib.Path) -> Callable[[str], Dict[str, Any]] | None:
+    """
+    Select the parse function from the suffix of the path.
+
+    Returns:
+        The parse function, or None if the suffix is unknown.
+    """
+    if path.suffix == '.RPB':
+        return rpb.parse
+    elif path.suffix == '.rpc':
+        return rpc.parse
+    elif path.name.endswith('_rpc.txt'):
+        return rpc_txt.parse
+    else:
+        return None
+
+
+@lru_cache(maxsize=128)
+def _read_file_cached(path: str, mtime_ns: int,
+                      parse: Callable[[str], Dict[str, Any]]) -> Dict[str, NDArray]:
+    # Failures are raised rather than returned, so that they are not
+    # cached, and are reported for every read.
+    data = normalize(parse(pathlib.Path(path).read_text()))
+    for array in data.values():
+        array.setflags(write=False)
+
+    return data
 
 
 def normalize(data: Dict[str, Any]) -> Dict[str, NDArray]:
-    image_off = np.empty(2, dtype=np.float64)
+    # All the values are stored in one buffer, and the arrays are views
+    # into it.
+    buffer = np.empty(2 + 2 + 3 + 3 + 4 * 20, dtype=np.float64)
+
+    image_off = buffer[0:2]
     image_off[0] = data['SAMP_OFF']
     image_off[1] = data['LINE_OFF']
 
-    image_scale = np.empty(2, dtype=np.float64)
+    image_scale = buffer[2:4]
     image_scale[0] = data['SAMP_SCALE']
     image_scale[1] = data['LINE_SCALE']
 
-    geo_off = np.empty(3, dtype=np.float64)
+    geo_off = buffer[4:7]
     geo_off[0] = data['LAT_OFF']
     geo_off[1] = data['LONG_OFF']
     geo_off[2] = data['HEIGHT_OFF']
 
-    geo_scale = np.empty(3, dtype=np.float64)
+    geo_scale = buffer[7:10]
     geo_scale[0] = data['LAT_SCALE']
     geo_scale[1] = data['LONG_SCALE']
     geo_scale[2] = data['HEIGHT_SCALE']
 
-    samp_num_coeff = np.array(data['SAMP_NUM_COEFF'], dtype=np.float64)
-    samp_den_coeff = np.array(data['SAMP_DEN_COEFF'], dtype=np.float64)
-    line_num_coeff = np.array(data['LINE_NUM_COEFF'], dtype=np.float64)
-    line_den_coeff = np.array(data['LINE_DEN_COEFF'], dtype=np.float64)
+    samp_num_coeff = buffer[10:30]
+    samp_num_coeff[:] = data['SAMP_NUM_COEFF']
+    samp_den_coeff = buffer[30:50]
+    samp_den_coeff[:] = data['SAMP_DEN_COEFF']
+    line_num_coeff = buffer[50:70]
+    line_num_coeff[:] = data['LINE_NUM_COEFF']
+    line_den_coeff = buffer[70:90]
+    line_den_coeff[:] = data['LINE_DEN_COEFF']
 
     return {
         'IMAGE_OFF': image_off,
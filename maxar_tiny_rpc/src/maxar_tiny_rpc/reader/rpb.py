@@ -5,7 +5,6 @@ from __future__ import annotations  # noqa
 
 import maxar_tiny_rpc.reader.common as c
 
-from parsy import Parser, seq, string
 from typing import Any, Dict
 
 
@@ -20,7 +19,17 @@ def parse(content: str) -> Dict[str, Any]:
     Returns:
         Dictionary with parsed values.
     """
-    _, data, _, _ = file().parse(content)
+    # The assignments before the image group are not used.
+    index = assignments(content, c.skip_whitespace(content, 0), list())
+
+    data = list()
+    index = expect(content, index, 'BEGIN_GROUP = IMAGE')
+    index = assignments(content, index, data)
+    index = expect(content, index, 'END_GROUP = IMAGE')
+    index = expect(content, index, 'END')
+    index = expect(content, index, ';')
+    if index < len(content):
+        raise c.ParseError('EOF', content, index)
 
     return remap(data)
 
@@ -53,31 +62,75 @@ def remap(data: list) -> Dict[str, Any]:
     return rpc
 
 
-def file() -> Parser:
-    return seq(assignment().many(),
-               group_begin() >> assignment().many() << group_end(),
-               end_file(), c.semicolon())
+def assignment(content: str) -> tuple[str, Any]:
+    """
+    Parse a single 'key = value;' assignment from the string.
+    """
+    data = list()
+    index = assignments(content, c.skip_whitespace(content, 0), data)
+    if len(data) != 1 or index < len(content):
+        raise c.ParseError('an assignment', content, index)
 
+    return data[0]
 
-def string_literal() -> Parser:
-    return c.quote() >> c.key() << c.quote()
 
+def assignments(content: str, index: int, data: list) -> int:
+    """
+    Scan the assignments starting at the index, and append them to data
+    as key and value tuples. The scanning stops at the first statement
+    that is not an assignment.
+
+    Returns:
+        The index after the last assignment.
+    """
+    while True:
+        equals = content.find('=', index)
+        if equals < 0:
+            return index
 
-def array() -> Parser:
-    return c.lparen() >> (c.number() << c.comma().optional()).many() << c.rparen()
+        if content[index:equals].strip() in ('BEGIN_GROUP', 'END_GROUP'):
+            return index
 
+        key = c.key(content, index, equals)
 
-def assignment() -> Parser:
-    return seq(c.key() << c.equals(), (c.number() | string_literal() | array()) << c.semicolon())
+        semicolon = content.find(';', equals)
+        if semicolon < 0:
+            raise c.ParseError("';'", content, len(content))
 
+        data.append((key, value(content, equals + 1, semicolon)))
+        index = c.skip_whitespace(content, semicolon + 1)
 
-def group_begin() -> Parser:
-    return c.lexeme(string('BEGIN_GROUP = IMAGE'))
 
+def value(content: str, start: int, end: int) -> Any:
+    """
+    Scan a value in content[start:end]. The kind of value, string literal,
+    array or number, is given by its first character.
+    """
+    start = c.skip_whitespace(content, start)
+    end = len(content[start:end].rstrip()) + start
 
-def group_end() -> Parser:
-    return c.lexeme(string('END_GROUP = IMAGE'))
+    if content.startswith('"', start):
+        if end - start < 2 or content[end - 1] != '"':
+            raise c.ParseError("'\"'", content, end)
 
+        return c.key(content, start + 1, end - 1)
+    elif content.startswith('(', start):
+        if end - start < 2 or content[end - 1] != ')':
+            raise c.ParseError("')'", content, end)
+
+        return c.number_list(content, start + 1, end - 1)
+    else:
+        return c.number(content, start, end)
+
+
+def expect(content: str, index: int, token: str) -> int:
+    """
+    Expect the token at the index.
+
+    Returns:
+        The index after the token and its trailing whitespace.
+    """
+    if not content.startswith(token, index):
+        raise c.ParseError(f"'{token}'", content, index)
 
-def end_file() -> Parser:
-    return c.lexeme(string('END'))
+    return c.skip_whitespace(content, index + len(token))
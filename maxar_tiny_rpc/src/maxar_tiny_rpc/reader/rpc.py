@@ -5,29 +5,25 @@ from __future__ import annotations  # noqa
 
 import maxar_tiny_rpc.reader.common as c
 
-from parsy import Parser, regex, seq, string
 from typing import Any, Dict
 
+# Pattern for an assignment, where also numbers with leading zeros are
+# accepted, optionally followed by a unit.
+_ASSIGNMENT_RE = c.key_number_re(
+    number=r'[-\+]?(?=[.]?[0-9])[0-9]*(?:[.][0-9]+)?(?:[eE][+-]?[0-9]+)?',
+    units=('pixels', 'meters', 'degrees'))
+
 
 def parse(content: str) -> Dict[str, Any]:
     """
     Parse _rpc.txt from the string and produce a normalized dictionary
     with the parsed data.
     """
-    return c.remap(file().parse(content))
-
-
-def file() -> Parser:
-    return assignment().many()
-
-
-def assignment() -> Parser:
-    return seq(c.key() << c.colon(), degenerate_number() << unit().optional())
+    return c.remap(assignments(content))
 
 
-def degenerate_number() -> Parser:
-    return c.lexeme(regex(r'[-\+]?([0-9]*)([.][0-9]+)?([eE][+-]?[0-9]+)?')).map(float)
-
-
-def unit() -> Parser:
-    return c.lexeme(string('pixels') | string('meters') | string('degrees'))
+def assignments(content: str) -> list[tuple[str, float]]:
+    """
+    Scan the 'KEY: number unit' assignments from the string.
+    """
+    return c.key_number_lines(content, _ASSIGNMENT_RE)
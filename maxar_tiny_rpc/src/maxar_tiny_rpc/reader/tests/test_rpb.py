@@ -2,6 +2,7 @@ from __future__ import annotations  # noqa
 
 import maxar_tiny_rpc.reader.rpb as rpb
 
+import numpy as np
 import unittest
 
 
@@ -13,14 +14,14 @@ class RpbTest(unittest.TestCase):
     def test_numeric_assignment(self: RpbTest) -> None:
         str = 'errBias = 5.91;'
 
-        key, val = rpb.assignment().parse(str)
+        key, val = rpb.assignment(str)
         self.assertEqual('errBias', key)
         self.assertEqual(5.91, val)
 
     def test_string_assignment(self: RpbTest) -> None:
         str = 'satId = "WV02";'
 
-        key, val = rpb.assignment().parse(str)
+        key, val = rpb.assignment(str)
         self.assertEqual('satId', key)
         self.assertEqual('WV02', val)
 
@@ -48,9 +49,10 @@ class RpbTest(unittest.TestCase):
                         -3.406377E-08);
         """
 
-        key, val = rpb.assignment().parse(str)
+        key, val = rpb.assignment(str)
         self.assertEqual('lineNumCoef', key)
-        self.assertIsInstance(val, list)
+        self.assertIsInstance(val, np.ndarray)
+        self.assertEqual(np.float64, val.dtype)
         self.assertEqual(20, len(val))
 
         self.assertEqual(+7.428028E-03, val[0])
@@ -73,3 +75,10 @@ class RpbTest(unittest.TestCase):
         self.assertEqual(+2.691113E-07, val[17])
         self.assertEqual(+7.095370E-07, val[18])
         self.assertEqual(-3.406377E-08, val[19])
+
+    def test_array_separators(self: RpbTest) -> None:
+        str = 'sampDenCoef = (1.0 -2.5E-01, +3.0E+00,);'
+
+        key, val = rpb.assignment(str)
+        self.assertEqual('sampDenCoef', key)
+        self.assertEqual([1.0, -2.5E-01, +3.0E+00], val.tolist())
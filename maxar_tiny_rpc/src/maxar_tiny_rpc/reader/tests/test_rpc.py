@@ -0,0 +1,31 @@
+from __future__ import annotations  # noqa
+
+import maxar_tiny_rpc.reader.common as c
+import maxar_tiny_rpc.reader.rpc as rpc
+
+import unittest
+
+
+class RpcTest(unittest.TestCase):
+    """
+    Testing a few .rpc specific things.
+    """
+
+    def test_assignments_with_units(self: RpcTest) -> None:
+        str = """LINE_OFF: +003403.00 pixels
+                 LAT_OFF: +33.82252539 degrees
+                 HEIGHT_OFF: +0800.000 meters
+                 ERR_BIAS: 0000.00
+              """
+
+        data = rpc.assignments(str)
+        self.assertEqual([('LINE_OFF', 3403.0),
+                          ('LAT_OFF', 33.82252539),
+                          ('HEIGHT_OFF', 800.0),
+                          ('ERR_BIAS', 0.0)], data)
+
+    def test_assignment_without_colon(self: RpcTest) -> None:
+        str = 'LINE_OFF +003403.00 pixels'
+
+        with self.assertRaises(c.ParseError):
+            rpc.assignments(str)
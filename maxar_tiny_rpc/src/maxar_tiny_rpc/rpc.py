@@ -19,6 +19,12 @@ class Rpc:
     the constructor.
     """
 
+    # The attributes are fixed, and stored in slots rather than in a
+    # per-instance dictionary.
+    __slots__ = ('_image_off', '_image_scale', '_geo_off', '_geo_scale',
+                 '_geo_inv_scale', '_pixel_coeff_matrix', '_geo_norm',
+                 '_valid')
+
     def __init__(self: Rpc) -> None:
         """
         Initialization of an Rpc object. Default everything is initialized
@@ -29,10 +35,10 @@ class Rpc:
         self._image_scale = None
         self._geo_off = None
         self._geo_scale = None
-        self._line_num_coeff = None
-        self._line_den_coeff = None
-        self._samp_num_coeff = None
-        self._samp_den_coeff = None
+        self._geo_inv_scale = None
+        self._pixel_coeff_matrix = None
+        self._geo_norm = None
+        self._valid = False
 
     @staticmethod
     def from_file(path: pathlib.Path) -> Rpc | None:
@@ -55,11 +61,27 @@ class Rpc:
         self._image_scale = data['IMAGE_SCALE']
         self._geo_off = data['GEO_OFF']
         self._geo_scale = data['GEO_SCALE']
+        self._geo_inv_scale = 1.0 / self._geo_scale
+
+        # The geo offsets and inverse scales as Python floats, for the
+        # single point projection.
+        self._geo_norm = tuple(self._geo_off.tolist()) + \
+            tuple(self._geo_inv_scale.tolist())
+
+        # The coefficients are stacked in a matrix, so that all four
+        # polynomials are evaluated with one product. The image scale and
+        # offset are folded into the numerators, so that the quotients
+        # directly are the pixel coordinates:
+        # num / den * scale + off = (num * scale + den * off) / den
+        coeff_matrix = np.stack((data['SAMP_NUM_COEFF'],
+                                 data['SAMP_DEN_COEFF'],
+                                 data['LINE_NUM_COEFF'],
+                                 data['LINE_DEN_COEFF']))
+        coeff_matrix[0::2] *= self._image_scale[:, np.newaxis]
+        coeff_matrix[0::2] += coeff_matrix[1::2] * self._image_off[:, np.newaxis]
+        self._pixel_coeff_matrix = coeff_matrix
 
-        self._line_num_coeff = data['LINE_NUM_COEFF']
-        self._line_den_coeff = data['LINE_DEN_COEFF']
-        self._samp_num_coeff = data['SAMP_NUM_COEFF']
-        self._samp_den_coeff = data['SAMP_DEN_COEFF']
+        self._valid = True
 
         return self
 
@@ -70,14 +92,7 @@ class Rpc:
         Returns:
             True if the object is valid, else False.
         """
-        return self._image_off is not None and \
-            self._image_scale is not None and \
-            self._geo_off is not None and \
-            self._geo_scale is not None and \
-            self._line_num_coeff is not None and \
-            self._line_den_coeff is not None and \
-            self._samp_num_coeff is not None and \
-            self._samp_den_coeff is not None
+        return self._valid
 
     def ground_to_image(self: Rpc, llh: ArrayLike) -> NDArray:
         """
@@ -91,12 +106,40 @@ class Rpc:
         """
         assert self.valid()
 
-        P, L, H = (np.array(llh) - self._geo_off) / self._geo_scale
-        p = Rpc._geo_array(P, L, H)
-        c = np.dot(self._samp_num_coeff, p) / np.dot(self._samp_den_coeff, p)
-        r = np.dot(self._line_num_coeff, p) / np.dot(self._line_den_coeff, p)
+        lat, lon, h = llh.tolist() if isinstance(llh, np.ndarray) else llh
+
+        return _ground_to_image_kernel(lat, lon, h, self._geo_norm,
+                                       self._pixel_coeff_matrix)
+
+    def ground_to_image_batch(self: Rpc, llh: ArrayLike) -> NDArray:
+        """
+        Project a batch of ground points to the image plane.
+
+        Parameters:
+            llh: Array with shape (N, 3), with latitude, longitude and height.
+
+        Returns:
+            A numpy array with shape (N, 2), with x (sample) and y (line)
+            in pixel coordinates.
+        """
+        assert self.valid()
+
+        normalized = np.subtract(llh, self._geo_off, dtype=np.float64)
+        assert normalized.ndim == 2 and normalized.shape[1] == 3
+        normalized *= self._geo_inv_scale
+        P, L, H = normalized.T
+
+        # The monomials for all points, with one column per point, and
+        # all four polynomials for all points in one product.
+        p = Rpc._geo_array(P, L, H, np.empty((20, len(normalized)),
+                                             dtype=np.float64))
+        samp_num, samp_den, line_num, line_den = self._pixel_coeff_matrix @ p
 
-        return (np.array((c, r)) * self._image_scale) + self._image_off
+        out = np.empty((len(normalized), 2), dtype=np.float64)
+        np.divide(samp_num, samp_den, out=out[:, 0])
+        np.divide(line_num, line_den, out=out[:, 1])
+
+        return out
 
     def image_to_ground(self: Rpc, px: ArrayLike, height: float) -> NDArray | None:
         """
@@ -113,46 +156,171 @@ class Rpc:
         # The initial guess is the lat, long at the center of the RPC.
         x0 = self._geo_off[:2].copy()
 
+        px = np.asarray(px, dtype=np.float64)
+
+        # The normalized height is fixed during the fitting, and so are the
+        # monomials only depending on it. They are computed once, into the
+        # monomial array reused by all the function evaluations.
+        P_off, L_off, H_off = self._geo_off
+        P_inv_scale, L_inv_scale, H_inv_scale = self._geo_inv_scale
+
+        H = (height - H_off) * H_inv_scale
+        H2 = H * H
+        monomials = Rpc._geo_array(0., 0., H)
+        px_hat = np.empty(2, dtype=np.float64)
+
         # Function to evaluate reprojection error during fitting.
         def func(x: NDArray) -> NDArray:
-            x = np.append(x, height)
+            P = (x[0] - P_off) * P_inv_scale
+            L = (x[1] - L_off) * L_inv_scale
 
-            px_hat = self.ground_to_image(x)
+            Rpc._geo_array_fixed_H(P, L, H, H2, monomials)
+            self._monomials_to_image(monomials, px_hat)
 
             # Trick: to have as many residuals as parameters don't take
             # the norm of the difference, instead let each pixel coordinate
             # become its own residual.
             return px_hat - px
 
-        result = leastsq(func, x0, steps=1e-08)
+        # The analytic Jacobian of the residuals, from the quotient rule
+        # on the polynomials.
+        derivatives = np.empty((20, 2), dtype=np.float64)
+        derivatives[(3, 9, 19), :] = 0.
+        inv_scale = self._geo_inv_scale[:2]
+
+        def jacobian(x: NDArray) -> NDArray:
+            P = (x[0] - P_off) * P_inv_scale
+            L = (x[1] - L_off) * L_inv_scale
+
+            Rpc._geo_array_fixed_H(P, L, H, H2, monomials)
+            Rpc._geo_array_jacobian(P, L, H, H2, derivatives)
+
+            samp_num, samp_den, line_num, line_den = \
+                self._pixel_coeff_matrix @ monomials
+            d_samp_num, d_samp_den, d_line_num, d_line_den = \
+                self._pixel_coeff_matrix @ derivatives
+
+            J = np.empty((2, 2), dtype=np.float64)
+            J[0] = (d_samp_num - d_samp_den * (samp_num / samp_den)) / samp_den
+            J[1] = (d_line_num - d_line_den * (line_num / line_den)) / line_den
+            J *= inv_scale
+
+            return J
+
+        result = leastsq(func, x0, jacobian=jacobian)
         if result['successful']:
-            return np.append(result['params'], height)
+            llh = np.empty(3, dtype=np.float64)
+            llh[:2] = result['params']
+            llh[2] = height
+            return llh
         else:
             print(f"Error: {result['message']}")
             return None
 
+    def _monomials_to_image(self: Rpc, p: NDArray, out: NDArray) -> NDArray:
+        # Evaluate the polynomials for the monomials, and write the pixel
+        # into the 2-element out array.
+        samp_num, samp_den, line_num, line_den = self._pixel_coeff_matrix @ p
+        out[0] = samp_num / samp_den
+        out[1] = line_num / line_den
+
+        return out
+
+    @staticmethod
+    def _geo_array(P: float, L: float, H: float,
+                   out: NDArray | None = None) -> NDArray:
+        # The monomials are written to out, if given, to let callers
+        # evaluating many points reuse the same array. P, L and H can
+        # also be arrays with N values, and out then has shape (20, N).
+        arr = np.empty(20, dtype=np.float64) if out is None else out
+
+        H2 = H * H
+
+        arr[3] = H
+        arr[9] = H2
+        arr[19] = H2 * H
+        Rpc._geo_array_fixed_H(P, L, H, H2, arr)
+
+        return arr
+
     @staticmethod
-    def _geo_array(P: float, L: float, H: float) -> NDArray:
-        arr = np.empty(20, dtype=np.float64)
+    def _geo_array_fixed_H(P: float, L: float, H: float, H2: float,
+                           arr: NDArray) -> None:
+        # Write all the monomials, except for those only depending on
+        # H (H, H^2 and H^3), which are expected to already be in arr.
+
+        # Products shared between several of the monomials.
+        LP = L * P
+        L2 = L * L
+        P2 = P * P
+
         arr[0] = 1.
         arr[1] = L
         arr[2] = P
-        arr[3] = H
-        arr[4] = L * P
+        arr[4] = LP
         arr[5] = L * H
         arr[6] = P * H
-        arr[7] = L ** 2
-        arr[8] = P ** 2
-        arr[9] = H ** 2
-        arr[10] = P * L * H
-        arr[11] = L ** 3
-        arr[12] = L * P ** 2
-        arr[13] = L * H ** 2
-        arr[14] = L ** 2 * P
-        arr[15] = P ** 3
-        arr[16] = P * H ** 2
-        arr[17] = L ** 2 * H
-        arr[18] = P ** 2 * H
-        arr[19] = H ** 3
+        arr[7] = L2
+        arr[8] = P2
+        arr[10] = LP * H
+        arr[11] = L2 * L
+        arr[12] = L * P2
+        arr[13] = L * H2
+        arr[14] = L2 * P
+        arr[15] = P2 * P
+        arr[16] = P * H2
+        arr[17] = L2 * H
+        arr[18] = P2 * H
 
-        return arr
+    @staticmethod
+    def _geo_array_jacobian(P: float, L: float, H: float, H2: float,
+                            arr: NDArray) -> None:
+        # Write the derivatives of the monomials with respect to P and L,
+        # as the columns of the (20, 2) arr. The derivatives of the
+        # monomials only depending on H are zero, and are expected to
+        # already be in arr.
+        LP = L * P
+        L2 = L * L
+        P2 = P * P
+
+        arr[0] = 0., 0.
+        arr[1] = 0., 1.
+        arr[2] = 1., 0.
+        arr[4] = L, P
+        arr[5] = 0., H
+        arr[6] = H, 0.
+        arr[7] = 0., 2. * L
+        arr[8] = 2. * P, 0.
+        arr[10] = L * H, P * H
+        arr[11] = 0., 3. * L2
+        arr[12] = 2. * LP, P2
+        arr[13] = 0., H2
+        arr[14] = L2, 2. * LP
+        arr[15] = 3. * P2, 0.
+        arr[16] = H2, 0.
+        arr[17] = 0., 2. * L * H
+        arr[18] = 2. * P * H, 0.
+
+
+def _ground_to_image_kernel(lat: float, lon: float, h: float,
+                            geo_norm: tuple[float, ...],
+                            coeff_matrix: NDArray) -> NDArray:
+    # The complete single point projection. The normalization and the
+    # monomials are computed with Python floats, which is much cheaper
+    # than Numpy scalars, and only the polynomials are evaluated by Numpy.
+    P_off, L_off, H_off, P_inv_scale, L_inv_scale, H_inv_scale = geo_norm
+    P = (lat - P_off) * P_inv_scale
+    L = (lon - L_off) * L_inv_scale
+    H = (h - H_off) * H_inv_scale
+
+    LP = L * P
+    L2 = L * L
+    P2 = P * P
+    H2 = H * H
+
+    p = np.array((1., L, P, H, LP, L * H, P * H, L2, P2, H2,
+                  LP * H, L2 * L, L * P2, L * H2, L2 * P,
+                  P2 * P, P * H2, L2 * H, P2 * H, H2 * H), dtype=np.float64)
+    samp_num, samp_den, line_num, line_den = (coeff_matrix @ p).tolist()
+
+    return np.array((samp_num / samp_den, line_num / line_den), dtype=np.float64)
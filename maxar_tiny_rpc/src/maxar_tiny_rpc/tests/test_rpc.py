@@ -0,0 +1,66 @@
+from __future__ import annotations  # noqa
+
+from maxar_tiny_fit import leastsq
+from maxar_tiny_rpc import Rpc
+
+import numpy as np
+from numpy.typing import NDArray
+import pathlib
+import unittest
+from unittest import mock
+
+_DATA_DIR = pathlib.Path(__file__).parent.parent.absolute() / 'reader' / 'tests' / 'data'
+
+
+def _rpcs() -> list[Rpc]:
+    return [Rpc.from_file(_DATA_DIR / name)
+            for name in ('test.RPB', 'test.rpc', 'test_rpc.txt')]
+
+
+def _ground_points(rpc: Rpc) -> NDArray:
+    # Points spread over the valid region of the RPC.
+    rng = np.random.default_rng(0)
+    return rpc._geo_off + rng.uniform(-0.8, 0.8, (50, 3)) * rpc._geo_scale
+
+
+class RpcTest(unittest.TestCase):
+    """
+    Testing that the fast projection paths agree with the reference ones.
+    """
+
+    def test_ground_to_image_batch(self: RpcTest) -> None:
+        for rpc in _rpcs():
+            llh = _ground_points(rpc)
+
+            px = rpc.ground_to_image_batch(llh)
+            self.assertEqual((len(llh), 2), px.shape)
+            for i in range(len(llh)):
+                np.testing.assert_allclose(px[i], rpc.ground_to_image(llh[i]),
+                                           rtol=1e-12, atol=1e-9)
+
+    def test_image_to_ground_jacobian(self: RpcTest) -> None:
+        for rpc in _rpcs():
+            llh = _ground_points(rpc)[0]
+            px = rpc.ground_to_image(llh)
+
+            # Capture the residual function and the analytic Jacobian given
+            # to leastsq by image_to_ground.
+            with mock.patch('maxar_tiny_rpc.rpc.leastsq', wraps=leastsq) as fit:
+                result = rpc.image_to_ground(px, llh[2])
+            func = fit.call_args.args[0]
+            jacobian = fit.call_args.kwargs['jacobian']
+
+            np.testing.assert_allclose(result, llh, rtol=0., atol=1e-6)
+
+            for x in _ground_points(rpc)[:10, :2]:
+                # Central differences, with steps relative to the RPC scale.
+                steps = 1e-6 * rpc._geo_scale[:2]
+                J_num = np.empty((2, 2))
+                for i in range(2):
+                    step = np.zeros(2)
+                    step[i] = steps[i]
+                    J_num[:, i] = (func(x + step) - func(x - step)) / (2. * steps[i])
+
+                J = jacobian(x)
+                np.testing.assert_allclose(J, J_num, rtol=0.,
+                                           atol=1e-6 * np.abs(J_num).max())